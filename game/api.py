@@ -5,24 +5,54 @@ Handles interactions with the Google Gemini AI API for generating game content.
 """
 
 import os
+import asyncio
+import atexit
 import logging
 import random
 import string
 import json
 import re
+import textwrap
+import threading
+import functools
+import hashlib
+from collections import OrderedDict
+import httpx
 from dotenv import load_dotenv
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from typing import List, Dict, Optional, Any, TypedDict
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+__all__ = [
+    'MODEL_NAME', 'SYSTEM_INSTRUCTIONS', 'TravelerDocument', 'AIJudgment',
+    'get_api_key_from_user', 'get_client', 'run_sync', 'run_in_background',
+    'generate_local_name', 'generate_permit_number', 'generate_random_permit_number',
+    'generate_text', 'generate_text_async',
+    'generate_clean_name', 'generate_clean_name_async',
+    'generate_document_for_setting', 'generate_document_for_setting_async',
+    'generate_fast_document', 'generate_fast_document_async',
+    'generate_consistent_backstory', 'generate_consistent_backstory_async',
+    'get_veritas_hint', 'get_veritas_hint_async',
+    'generate_document_error', 'generate_document_error_async',
+    'ai_judge_document', 'ai_judge_document_async',
+    'batched_turn_call', 'batched_turn_call_async',
+    'generate_narrative_update', 'generate_narrative_update_async',
+]
+
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+MODEL_NAME = "gemini-2.0-flash-lite"
+
+# Maximum number of Gemini requests allowed in flight at the same time
+MAX_CONCURRENT_REQUESTS = 4
+
+# How long idle connections stay open; a turn rarely takes longer than this
+KEEPALIVE_EXPIRY_SECONDS = 60
 
-api_key = os.getenv("GEMINI_API_KEY")
+# Transient failures (rate limits, overloaded servers, timeouts) are retried with
+# exponential backoff; anything else fails immediately
+RETRY_ATTEMPTS = 4
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
 def get_api_key_from_user():
     """Prompt the user to enter their API key and save it to .env file."""
@@ -57,10 +87,132 @@ def get_api_key_from_user():
     print("\033[32mAPI key saved to .env file.\033[0m")
     return api_key
 
-if not api_key:
-    api_key = get_api_key_from_user()
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """
+    Get the shared Gemini client, creating it on first use.
+    
+    Returns:
+        genai.Client: The Gemini API client.
+    """
+    # Load environment variables
+    load_dotenv()
+    
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        api_key = get_api_key_from_user()
+    
+    # Keep connections open between turns so later requests skip the TCP/TLS handshake
+    http_options = types.HttpOptions(
+        async_client_args={
+            "limits": httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS * 2,
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+            )
+        }
+    )
+    
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+# All API coroutines run on one long-lived event loop in a background thread so the
+# async HTTP client keeps its connections between calls and callers never block
+# each other on loop setup/teardown.
+_loop = None
+_loop_lock = threading.Lock()
+_request_semaphore = None
 
-client = genai.Client(api_key=api_key)
+def _get_event_loop():
+    """
+    Get the background event loop used for API calls, starting it if needed.
+    
+    Returns:
+        asyncio.AbstractEventLoop: The running API event loop.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name="veritaminal-api", daemon=True)
+            thread.start()
+    return _loop
+
+def run_sync(coro):
+    """
+    Run a coroutine on the API event loop and wait for its result.
+    
+    Args:
+        coro (coroutine): The coroutine to run.
+        
+    Returns:
+        Any: The coroutine's result.
+    """
+    return run_in_background(coro).result()
+
+def run_in_background(coro):
+    """
+    Schedule a coroutine on the API event loop without waiting for it.
+    
+    Args:
+        coro (coroutine): The coroutine to run.
+        
+    Returns:
+        concurrent.futures.Future: Future holding the coroutine's result.
+    """
+    # Create the client here so a missing API key is asked for on the caller's thread
+    get_client()
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop())
+
+def _is_retryable(error):
+    """
+    Check whether a failed request is worth retrying.
+    
+    Args:
+        error (Exception): The error raised by the request.
+        
+    Returns:
+        bool: True for rate limits, server overload and network timeouts.
+    """
+    if isinstance(error, errors.APIError):
+        return error.code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TimeoutException, httpx.NetworkError, asyncio.TimeoutError))
+
+async def _generate_content_async(prompt, config):
+    """
+    Send a generate_content request, respecting the concurrency cap and
+    retrying transient failures.
+    
+    Args:
+        prompt (str): The prompt to send to the API.
+        config (types.GenerateContentConfig): The generation config.
+        
+    Returns:
+        types.GenerateContentResponse: The API response.
+        
+    Raises:
+        Exception: The last error if the request failed for good.
+    """
+    global _request_semaphore
+    # Created lazily so it belongs to the API event loop
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            async with _request_semaphore:
+                return await get_client().aio.models.generate_content(
+                    model=MODEL_NAME,
+                    contents=prompt,
+                    config=config
+                )
+        except Exception as e:
+            if attempt == RETRY_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            # Sleep outside the semaphore so other requests can proceed
+            delay = 2 ** attempt + random.random()
+            logger.warning("Gemini request failed (%s), retrying in %.1fs", e, delay)
+            await asyncio.sleep(delay)
 
 # Define Pydantic-like schemas for API responses
 class TravelerDocument(TypedDict):
@@ -129,12 +281,351 @@ SYSTEM_INSTRUCTIONS = {
     """
 }
 
-def generate_permit_number(valid=True):
+# Response schemas for structured JSON output; the API guarantees responses match them
+JUDGMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "decision": {"type": "string", "enum": ["approve", "deny"]},
+        "confidence": {"type": "number", "description": "Confidence between 0.0 and 1.0"},
+        "reasoning": {"type": "string", "description": "Explanation of the decision"},
+        "suspicious_elements": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["decision", "confidence", "reasoning", "suspicious_elements"]
+}
+
+TURN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "judgment": JUDGMENT_SCHEMA,
+        "hint": {"type": "string", "description": "Veritas' hint for the agent"}
+    },
+    "required": ["judgment", "hint"]
+}
+
+# Free-form fields are a list of pairs because schema objects need fixed properties
+DOCUMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "Full name (first and last) with no label"},
+        "backstory": {"type": "string", "description": "One-sentence backstory that mentions the name"},
+        "additional_fields": {
+            "type": "array",
+            "description": "Relevant border-specific document details",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "field": {"type": "string"},
+                    "value": {"type": "string"}
+                },
+                "required": ["field", "value"]
+            }
+        }
+    },
+    "required": ["name", "backstory", "additional_fields"]
+}
+
+# Prompt templates for the per-turn requests. The fixed instructions come first
+# so consecutive requests share the longest possible prefix for implicit caching.
+_DOCUMENT_FIELDS = """Name: $name
+Permit: $permit
+Backstory: $backstory"""
+
+_HINT_TMPL = string.Template(textwrap.dedent("""\
+    Provide a subtle hint about document authenticity without directly revealing if it's valid or not.
+    Consider the border setting and recent history in your response.
+
+    $memory
+
+    Analyze this traveler:
+    """) + _DOCUMENT_FIELDS + "\n")
+
+_JUDGE_TMPL = string.Template(textwrap.dedent("""\
+    Evaluate the document below based on the border rules and situation.
+    Determine if this traveler should be approved or denied entry.
+
+    $setting
+
+    $memory
+
+    DOCUMENT TO EVALUATE:
+    """) + _DOCUMENT_FIELDS + "\n")
+
+_TURN_TMPL = string.Template(textwrap.dedent("""\
+    Evaluate the document below based on the border rules and situation.
+    Determine if this traveler should be approved or denied entry.
+
+    Also write a hint as Veritas, the agent's AI assistant: a subtle, neutral
+    observation about the document's authenticity that points the agent's
+    attention to potential issues or confirmations without revealing your decision.
+
+    $setting
+
+    $memory
+
+    DOCUMENT TO EVALUATE:
+    """) + _DOCUMENT_FIELDS + "\n")
+
+_NARRATIVE_TMPL = string.Template(textwrap.dedent("""\
+    Generate a brief narrative update (1-2 sentences) describing the consequences of this decision.
+    Consider the border setting and game history in your response.
+
+    $memory
+
+    Player decision: $decision
+    Decision correctness: $correctness
+    Current corruption level: $corruption
+    Current trust level: $trust
+    """))
+
+# Realistic output budgets per system type; larger requested limits are clipped
+MAX_OUTPUT_TOKENS = {
+    "document_generation": 250,
+    "veritas_assistant": 100,
+    "narrative_generation": 80,   # 1-2 sentences
+    "ai_judgment": 400            # judgment JSON, plus the hint when batched
+}
+
+# Strip the source indentation once so it isn't sent (and billed) on every request
+SYSTEM_INSTRUCTIONS = {key: textwrap.dedent(text).strip() for key, text in SYSTEM_INSTRUCTIONS.items()}
+
+def _build_config(system_type, **config_args):
+    """
+    Build a generation config with the system instruction for a system type.
+    
+    Args:
+        system_type (str): Type of system instruction to use.
+        **config_args: Other GenerateContentConfig fields.
+        
+    Returns:
+        types.GenerateContentConfig: The generation config.
+    """
+    system_instruction = SYSTEM_INSTRUCTIONS.get(system_type, SYSTEM_INSTRUCTIONS["document_generation"])
+    return types.GenerateContentConfig(system_instruction=system_instruction, **config_args)
+
+# Responses are reused for identical (prompt, system_type, max_tokens) requests
+RESPONSE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".veritaminal_cache.json")
+RESPONSE_CACHE_SIZE = 1024
+
+_response_cache = None
+
+# The cache is filled on the API loop thread but saved from the main thread at exit
+_response_cache_lock = threading.Lock()
+
+def _response_cache_key(prompt, system_type, max_tokens):
+    """
+    Build a compact response-cache key from a 128-bit digest of the prompt.
+    
+    The first 64 bits key the entry. The other 64 bits are stored with it to
+    detect collisions, since prompts built from the same template all start
+    with the same fixed instructions and can't be told apart by a prefix.
+    
+    Args:
+        prompt (str): The prompt sent to the API.
+        system_type (str): Type of system instruction used.
+        max_tokens (int): Maximum number of tokens generated.
+        
+    Returns:
+        tuple: ((prompt digest, system_type, max_tokens), check digest)
+    """
+    digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest()
+    return (int.from_bytes(digest[:8], 'big'), system_type, max_tokens), int.from_bytes(digest[8:], 'big')
+
+def _load_response_cache():
+    """
+    Load the response cache from disk on first use.
+    
+    Returns:
+        OrderedDict: (check digest, text) pairs in least-recently-used order.
+    """
+    global _response_cache
+    if _response_cache is None:
+        cache = OrderedDict()
+        try:
+            with open(RESPONSE_CACHE_PATH, 'r', encoding='utf-8') as f:
+                for entry in json.load(f):
+                    # Entries written by older versions keyed on the full prompt
+                    if len(entry) != 5:
+                        continue
+                    digest, system_type, max_tokens, check, text = entry
+                    # Entries written by older versions stored a prompt prefix instead
+                    if not isinstance(check, int) or not isinstance(text, str) or not text:
+                        continue
+                    cache[(digest, system_type, max_tokens)] = (check, text)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable response cache: {e}")
+        with _response_cache_lock:
+            _response_cache = cache
+    return _response_cache
+
+def _save_response_cache():
+    """
+    Write the response cache to disk.
+    """
+    with _response_cache_lock:
+        if not _response_cache:
+            return
+        entries = [list(key) + list(value) for key, value in _response_cache.items()]
+    try:
+        with open(RESPONSE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+    except Exception as e:
+        logger.warning(f"Failed to save response cache: {e}")
+
+atexit.register(_save_response_cache)
+
+def _response_text(response):
+    """
+    Get the text of a response, treating a missing or blank text as a failure.
+    
+    Args:
+        response: The GenerateContentResponse.
+        
+    Returns:
+        str: The response text.
+        
+    Raises:
+        ValueError: If the response has no text.
+    """
+    text = response.text
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("Gemini returned an empty response")
+    return text
+
+async def _generate_cached_text_async(prompt, system_type, max_tokens, no_cache=False, **config_args):
+    """
+    Generate text, reusing a previous response to the same request when available.
+    
+    Args:
+        prompt (str): The prompt to send to the API.
+        system_type (str): Type of system instruction to use.
+        max_tokens (int): Maximum number of tokens to generate.
+        no_cache (bool): Always call the API and don't store the result. Use for
+                         calls that are expected to produce a different answer each time.
+        **config_args: Other GenerateContentConfig fields.
+        
+    Returns:
+        str: The response text.
+        
+    Raises:
+        ValueError: If the model returned no text (e.g. a blocked or empty candidate).
+    """
+    if no_cache:
+        response = await _generate_content_async(
+            prompt,
+            _build_config(system_type, max_output_tokens=max_tokens, **config_args)
+        )
+        return _response_text(response)
+    
+    cache = _load_response_cache()
+    key, check = _response_cache_key(prompt, system_type, max_tokens)
+    with _response_cache_lock:
+        entry = cache.get(key)
+        if entry is not None and entry[0] == check:
+            cache.move_to_end(key)
+            return entry[1]
+    
+    response = await _generate_content_async(
+        prompt,
+        _build_config(system_type, max_output_tokens=max_tokens, **config_args)
+    )
+    # Raises before caching, so blocked or empty responses are never served again
+    text = _response_text(response)
+    
+    with _response_cache_lock:
+        cache[key] = (check, text)
+        cache.move_to_end(key)
+        if len(cache) > RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    return text
+
+# Compiled once; used on every name and JSON response
+_JSON_DECODER = json.JSONDecoder()
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_NAME_PREFIX_RE = re.compile(r'^(Name:|Full name:|Traveler:|Traveler name:)\s*', re.IGNORECASE)
+_NAME_MARKUP_RE = re.compile(r'["*_]')
+
+def _parse_json_object(text):
+    """
+    Parse the JSON object embedded in a model response.
+    
+    Tolerates markdown code fences, prose before or after the object (even if
+    it contains braces) and trailing commas, so fewer responses fall through
+    to the per-field fallback requests.
+    
+    Args:
+        text (str): The response text, possibly with extra content around the JSON.
+        
+    Returns:
+        Any: The parsed JSON value.
+        
+    Raises:
+        json.JSONDecodeError: If no valid JSON could be found.
+    """
+    start = text.find('{')
+    if start == -1:
+        return json.loads(text)
+    
+    first_error = None
+    while start != -1:
+        try:
+            # Decode the first complete object and ignore whatever follows it
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            try:
+                repaired = _TRAILING_COMMA_RE.sub(r'\1', text[start:])
+                return _JSON_DECODER.raw_decode(repaired)[0]
+            except json.JSONDecodeError as e:
+                first_error = first_error or e
+        # The brace belonged to prose; try the next one
+        start = text.find('{', start + 1)
+    
+    raise first_error
+
+# Local name pool used in fast mode and when the API can't provide a name
+FALLBACK_FIRST_NAMES = [
+    "Alex", "Sam", "Jordan", "Morgan", "Casey", "Taylor", "Amara", "Dmitri",
+    "Ines", "Kenji", "Leila", "Mateo", "Noor", "Oskar", "Priya", "Tomasz"
+]
+FALLBACK_LAST_NAMES = [
+    "Smith", "Jones", "Garcia", "Chen", "Patel", "Müller", "Okafor", "Novak",
+    "Haddad", "Silva", "Kowalski", "Tanaka", "Lindqvist", "Moreau", "Reyes", "Ivanova"
+]
+
+def generate_local_name(used_names=None):
+    """
+    Pick a name from the local name pool without calling the API.
+    
+    Args:
+        used_names (set, optional): Names to avoid if possible.
+        
+    Returns:
+        str: A full name (first and last).
+    """
+    used_names = used_names or set()
+    name = f"{random.choice(FALLBACK_FIRST_NAMES)} {random.choice(FALLBACK_LAST_NAMES)}"
+    # Retry a few times to avoid repeats; the pool is large enough that this rarely loops
+    for _ in range(10):
+        if name not in used_names:
+            break
+        name = f"{random.choice(FALLBACK_FIRST_NAMES)} {random.choice(FALLBACK_LAST_NAMES)}"
+    return name
+
+# Permit outcomes drawn in one step: 70% valid, the rest split evenly across error types
+PERMIT_OUTCOMES = ['none', 'wrong_prefix', 'wrong_length', 'non_digit']
+PERMIT_OUTCOME_WEIGHTS = [70, 10, 10, 10]
+
+def generate_permit_number(valid=True, error_type=None):
     """
     Generate a permit number with controlled validity.
     
     Args:
         valid (bool): Whether to generate a valid permit number.
+        error_type (str, optional): Error to introduce into an invalid permit
+                                    ('wrong_prefix', 'wrong_length' or 'non_digit').
+                                    Picked at random if not given.
         
     Returns:
         str: A permit number (valid or invalid).
@@ -145,7 +636,7 @@ def generate_permit_number(valid=True):
         return 'P' + digits
     else:
         # Different types of errors with equal probability
-        error_type = random.choice(['wrong_prefix', 'wrong_length', 'non_digit'])
+        error_type = error_type or random.choice(PERMIT_OUTCOMES[1:])
         
         if error_type == 'wrong_prefix':
             # Use a different letter prefix
@@ -165,7 +656,19 @@ def generate_permit_number(valid=True):
             digits = digits[:position] + special_char + digits[position:]
             return 'P' + digits[:4]
 
-def generate_text(prompt, system_type="document_generation", max_tokens=200):
+def generate_random_permit_number():
+    """
+    Generate a permit number that is valid or carries an error, with a single random draw.
+    
+    Returns:
+        str: A permit number (valid or invalid).
+    """
+    outcome = random.choices(PERMIT_OUTCOMES, weights=PERMIT_OUTCOME_WEIGHTS)[0]
+    if outcome == 'none':
+        return generate_permit_number(valid=True)
+    return generate_permit_number(valid=False, error_type=outcome)
+
+async def generate_text_async(prompt, system_type="document_generation", max_tokens=200, no_cache=False):
     """
     Generate text using the Google Gemini AI API.
     
@@ -173,31 +676,36 @@ def generate_text(prompt, system_type="document_generation", max_tokens=200):
         prompt (str): The prompt to send to the API.
         system_type (str): Type of system instruction to use.
         max_tokens (int): Maximum number of tokens to generate.
+        no_cache (bool): Skip the response cache for deliberately varied output.
         
     Returns:
-        str: Generated text.
+        str or None: Generated text, or None if the request failed so the caller
+        can fall back to its own default.
     """
+    max_tokens = min(max_tokens, MAX_OUTPUT_TOKENS.get(system_type, max_tokens))
+    
     try:
-        # Select the appropriate system instruction
-        system_instruction = SYSTEM_INSTRUCTIONS.get(system_type, SYSTEM_INSTRUCTIONS["document_generation"])
-
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=max_tokens,
-                temperature=0.9,
-                system_instruction=system_instruction
-            )
+        return await _generate_cached_text_async(
+            prompt,
+            system_type,
+            max_tokens,
+            no_cache=no_cache,
+            temperature=0.9
         )
-        
-        return response.text
             
     except Exception as e:
         logger.error("Error generating text: %s", str(e))
-        return "Error generating text"
+        return None
 
-def generate_clean_name(used_names_context=""):
+def generate_text(prompt, system_type="document_generation", max_tokens=200, no_cache=False):
+    """
+    Generate text using the Google Gemini AI API.
+    
+    Blocking wrapper around generate_text_async.
+    """
+    return run_sync(generate_text_async(prompt, system_type, max_tokens, no_cache))
+
+async def generate_clean_name_async(used_names_context=""):
     """
     Generate a clean name without any prefixes or extra text.
     
@@ -215,10 +723,9 @@ def generate_clean_name(used_names_context=""):
     """
     
     try:
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
+        response = await _generate_content_async(
+            prompt,
+            types.GenerateContentConfig(
                 max_output_tokens=50,
                 temperature=0.9,
                 system_instruction="Return ONLY a name with first and last name. No additional text or explanation."
@@ -228,31 +735,37 @@ def generate_clean_name(used_names_context=""):
         name = response.text.strip()
         
         # Remove any common prefixes or formatting that might appear
-        name = re.sub(r'^(Name:|Full name:|Traveler:|Traveler name:)\s*', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'["*_]', '', name)  # Remove quotes, asterisks, underscores
+        name = _NAME_PREFIX_RE.sub('', name)
+        name = _NAME_MARKUP_RE.sub('', name)  # Remove quotes, asterisks, underscores
         
         return name
     except Exception as e:
         logger.error(f"Error generating clean name: {e}")
         # Return a random fallback name
-        first_names = ["Alex", "Sam", "Jordan", "Morgan", "Casey", "Taylor"]
-        last_names = ["Smith", "Jones", "Garcia", "Chen", "Patel", "Müller"]
-        return f"{random.choice(first_names)} {random.choice(last_names)}"
+        return generate_local_name()
+
+def generate_clean_name(used_names_context=""):
+    """
+    Generate a clean name without any prefixes or extra text.
+    
+    Blocking wrapper around generate_clean_name_async.
+    """
+    return run_sync(generate_clean_name_async(used_names_context))
 
-def generate_document_for_setting(setting, used_names_context="", system_type="document_generation", max_tokens=200):
+async def generate_document_for_setting_async(setting, used_names_context="", system_type="document_generation", max_tokens=250, used_names=None):
     """
     Generate a document tailored to a specific border setting.
     
     Args:
         setting (dict): The border setting to generate a document for.
         used_names_context (str): Context about previously used names to avoid repetition.
+        max_tokens (int): Output budget for the whole JSON document. Too small a budget
+                          truncates the JSON and forces the fallback path.
+        used_names (set, optional): Names the local fallback name should avoid.
         
     Returns:
         tuple: (name, permit, backstory, additional_fields)
     """
-    # Decide whether this document should be valid or invalid
-    should_be_valid = random.random() < 0.7  # 70% chance of valid document
-    
     context = f"""
     Border Setting: {setting['name']}
     Situation: {setting['situation']}
@@ -260,32 +773,24 @@ def generate_document_for_setting(setting, used_names_context="", system_type="d
     {used_names_context}
     
     Generate a traveler document for someone crossing this border.
-    Return ONLY a valid JSON object with these fields:
-    - name: A full name (first and last) different from previously seen travelers
-    - backstory: A one-sentence backstory that mentions the name
-    - additional_fields: Any relevant border-specific information
-    
-    DO NOT include labels like "Name:" in your output.
-    Return ONLY the JSON object with no additional text.
+    The name must be different from previously seen travelers.
     """
     
     try:
         # Generate document content with explicit schema enforcement
-        system_instruction = SYSTEM_INSTRUCTIONS.get(system_type, SYSTEM_INSTRUCTIONS["document_generation"])
-        
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=context,
-            config=types.GenerateContentConfig(
+        response = await _generate_content_async(
+            context,
+            _build_config(
+                system_type,
                 max_output_tokens=max_tokens,
                 temperature=0.9,
-                system_instruction=system_instruction,
-                response_mime_type="application/json"
+                response_mime_type="application/json",
+                response_schema=DOCUMENT_SCHEMA
             )
         )
         
         # Generate permit number using Python, not AI
-        permit = generate_permit_number(valid=should_be_valid)
+        permit = generate_random_permit_number()
         
         # Parse the response as JSON
         response_text = response.text.strip()
@@ -294,16 +799,7 @@ def generate_document_for_setting(setting, used_names_context="", system_type="d
         additional_fields = {}
         
         try:
-            # Clean the response text to ensure it's valid JSON
-            # Remove any non-JSON content
-            json_match = re.search(r'({.*})', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1)
-            else:
-                json_text = response_text
-                
-            # Parse JSON
-            json_data = json.loads(json_text)
+            json_data = _parse_json_object(response_text)
             
             # Extract fields, ensuring we get clean values
             if "name" in json_data and isinstance(json_data["name"], str):
@@ -315,30 +811,69 @@ def generate_document_for_setting(setting, used_names_context="", system_type="d
             if "backstory" in json_data and isinstance(json_data["backstory"], str):
                 backstory = json_data["backstory"].strip()
                 
-            if "additional_fields" in json_data and isinstance(json_data["additional_fields"], dict):
-                additional_fields = json_data["additional_fields"]
+            if isinstance(json_data.get("additional_fields"), list):
+                additional_fields = {
+                    item["field"]: item["value"]
+                    for item in json_data["additional_fields"]
+                    if isinstance(item, dict) and item.get("field") and "value" in item
+                }
             
         except json.JSONDecodeError:
             logger.error("Failed to parse JSON response: %s", response_text)
         
-        # Fallback values if parsing fails
+        # Fallback values if parsing fails. The name is picked locally so the
+        # slow path costs at most one more round-trip (the backstory needs the name).
         if not name:
-            name = generate_clean_name(used_names_context)
+            name = generate_local_name(used_names)
+            backstory = None
         
         if not backstory:
-            backstory = generate_consistent_backstory(name, "document_generation")
+            backstory = await generate_consistent_backstory_async(name, "document_generation")
                 
         return name, permit, backstory, additional_fields
         
     except Exception as e:
         logger.error(f"Error generating document for setting: {e}")
         # Return fallback values
-        name = generate_clean_name(used_names_context)
-        permit = generate_permit_number(valid=should_be_valid)
-        backstory = generate_consistent_backstory(name, "document_generation")
+        name = generate_local_name(used_names)
+        permit = generate_random_permit_number()
+        backstory = await generate_consistent_backstory_async(name, "document_generation")
         return name, permit, backstory, {}
 
-def generate_consistent_backstory(name, system_type="document_generation", max_tokens=100):
+def generate_document_for_setting(setting, used_names_context="", system_type="document_generation", max_tokens=250, used_names=None):
+    """
+    Generate a document tailored to a specific border setting.
+    
+    Blocking wrapper around generate_document_for_setting_async.
+    """
+    return run_sync(generate_document_for_setting_async(setting, used_names_context, system_type, max_tokens, used_names))
+
+async def generate_fast_document_async(setting, used_names=None):
+    """
+    Generate a document with a local name and permit; only the backstory uses the API.
+    
+    Args:
+        setting (dict): The border setting to generate a document for.
+        used_names (set, optional): Names already used, to avoid repetition.
+        
+    Returns:
+        tuple: (name, permit, backstory, additional_fields)
+    """
+    name = generate_local_name(used_names)
+    permit = generate_random_permit_number()
+    backstory = await generate_consistent_backstory_async(name, "document_generation")
+    
+    return name, permit, backstory, {}
+
+def generate_fast_document(setting, used_names=None):
+    """
+    Generate a document with a local name and permit; only the backstory uses the API.
+    
+    Blocking wrapper around generate_fast_document_async.
+    """
+    return run_sync(generate_fast_document_async(setting, used_names))
+
+async def generate_consistent_backstory_async(name, system_type="document_generation", max_tokens=100):
     """
     Generate a backstory that is consistent with the provided name.
     
@@ -348,26 +883,30 @@ def generate_consistent_backstory(name, system_type="document_generation", max_t
     Returns:
         str: A one-sentence backstory that uses the same name.
     """
-    system_instruction = SYSTEM_INSTRUCTIONS.get(system_type, SYSTEM_INSTRUCTIONS["document_generation"])
     prompt = f"Create a one-sentence backstory for a traveler named {name}. Make sure to use the exact name '{name}' in the backstory."
     
     try:
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=max_tokens,
-                temperature=0.9,
-                system_instruction=system_instruction
-            )
+        response_text = await _generate_cached_text_async(
+            prompt,
+            system_type,
+            max_tokens,
+            temperature=0.9
         )
         
-        return response.text.strip()
+        return response_text.strip()
     except Exception as e:
         logger.error("Error generating backstory: %s", str(e))
         return f"{name} is a traveler with no additional information available."
 
-def get_veritas_hint(doc, memory_context="", system_type="veritas_assistant", max_tokens=100):
+def generate_consistent_backstory(name, system_type="document_generation", max_tokens=100):
+    """
+    Generate a backstory that is consistent with the provided name.
+    
+    Blocking wrapper around generate_consistent_backstory_async.
+    """
+    return run_sync(generate_consistent_backstory_async(name, system_type, max_tokens))
+
+async def get_veritas_hint_async(doc, memory_context="", system_type="veritas_assistant", max_tokens=100):
     """
     Get a hint from Veritas about the document.
     
@@ -378,53 +917,128 @@ def get_veritas_hint(doc, memory_context="", system_type="veritas_assistant", ma
     Returns:
         str: A hint from Veritas.
     """
-    system_instruction = SYSTEM_INSTRUCTIONS.get(system_type, SYSTEM_INSTRUCTIONS["veritas_assistant"])
-    
-    prompt = f"""
-    {memory_context}
-    
-    Analyze this traveler:
-    Name: {doc['name']}
-    Permit: {doc['permit']}
-    Backstory: {doc['backstory']}
-    
-    Provide a subtle hint about document authenticity without directly revealing if it's valid or not.
-    Consider the border setting and recent history in your response.
-    """
+    prompt = _HINT_TMPL.substitute(
+        memory=memory_context,
+        name=doc['name'],
+        permit=doc['permit'],
+        backstory=doc['backstory']
+    )
     
-    response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=max_tokens,
-                temperature=0.9,
-                system_instruction=system_instruction
-            )
+    try:
+        response_text = await _generate_cached_text_async(
+            prompt,
+            system_type,
+            max_tokens,
+            temperature=0.9
         )
         
-    return response.text.strip()
+        return response_text.strip()
+    except Exception as e:
+        logger.error("Error generating hint: %s", str(e))
+        return "Veritas has nothing to add. Check the permit and backstory against the rules."
+
+def get_veritas_hint(doc, memory_context="", system_type="veritas_assistant", max_tokens=100):
+    """
+    Get a hint from Veritas about the document.
     
-def generate_document_error():
+    Blocking wrapper around get_veritas_hint_async.
+    """
+    return run_sync(get_veritas_hint_async(doc, memory_context, system_type, max_tokens))
+    
+async def generate_document_error_async():
     """
     Generate a random error to introduce into a document.
     
+    Optional flavor text only; the regular document flow introduces errors
+    locally through generate_random_permit_number.
+    
     Returns:
         str: Error description text
     """
     prompt = "Generate a realistic error that might appear in travel documentation. Format as: error_type: brief description"
 
-    response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=1000,
+    response = await _generate_content_async(
+            prompt,
+            types.GenerateContentConfig(
+                max_output_tokens=40,  # A single "error_type: description" line
                 temperature=0.9
             )
         )
     
     return response.text
 
-def ai_judge_document(doc, setting_context, memory_context, system_type="ai_judgment", max_tokens=300):
+def generate_document_error():
+    """
+    Generate a random error to introduce into a document.
+    
+    Blocking wrapper around generate_document_error_async.
+    """
+    return run_sync(generate_document_error_async())
+
+def _local_permit_judgment(doc):
+    """
+    Judge a document locally when its permit is malformed.
+    
+    Args:
+        doc (dict): The document to judge.
+        
+    Returns:
+        dict or None: A deny judgment if the permit is not 'P' followed by 4 digits,
+                      otherwise None.
+    """
+    permit = doc['permit']
+    if len(permit) == 5 and permit[0] == 'P' and permit[1:].isdigit():
+        return None
+    
+    return {
+        "decision": "deny",
+        "confidence": 0.9,
+        "reasoning": f"The permit number {permit} does not follow the required format of 'P' followed by 4 digits.",
+        "suspicious_elements": [f"Invalid permit format: {permit}"]
+    }
+
+def _finalize_judgment(judgment):
+    """
+    Fill in missing judgment fields and apply the gameplay balancing flip.
+    
+    Args:
+        judgment (dict): The judgment parsed from the AI response.
+        
+    Returns:
+        dict: The completed judgment.
+    """
+    # Ensure required fields are present
+    required_fields = ["decision", "confidence", "reasoning", "suspicious_elements"]
+    for field in required_fields:
+        if field not in judgment:
+            judgment[field] = "missing" if field != "confidence" else 0.5
+            
+    # Override with a balanced probability to ensure fair gameplay
+    if random.random() < 0.3:  # 30% chance to flip the decision
+        original_decision = judgment["decision"]
+        judgment["decision"] = "deny" if original_decision == "approve" else "approve"
+        judgment["confidence"] = max(0.1, min(0.7, judgment["confidence"]))  # Lower confidence when flipping
+    
+    return judgment
+
+def _fallback_judgment(reasoning):
+    """
+    Build a judgment with balanced probability when the AI can't provide one.
+    
+    Args:
+        reasoning (str): Reasoning text to show the player.
+        
+    Returns:
+        dict: The fallback judgment.
+    """
+    return {
+        "decision": "approve" if random.random() > 0.4 else "deny",  # 60% approve / 40% deny
+        "confidence": random.uniform(0.5, 0.8),
+        "reasoning": reasoning,
+        "suspicious_elements": []
+    }
+
+async def ai_judge_document_async(doc, setting_context, memory_context, system_type="ai_judgment", max_tokens=300):
     """
     Use AI to judge if a document should be approved or denied.
     
@@ -440,105 +1054,130 @@ def ai_judge_document(doc, setting_context, memory_context, system_type="ai_judg
             - reasoning: explanation of the decision
             - suspicious_elements: list of suspicious elements if any
     """
-    system_instruction = SYSTEM_INSTRUCTIONS.get(system_type, SYSTEM_INSTRUCTIONS["ai_judgment"])
-    
-    # Check if permit follows the required format: P followed by 4 digits
-    permit_valid = len(doc['permit']) == 5 and doc['permit'][0] == 'P' and doc['permit'][1:].isdigit()
-    
     # For more balanced gameplay, if the permit is invalid, we'll use our own judgment
     # rather than asking the AI
-    if not permit_valid:
-        return {
-            "decision": "deny",
-            "confidence": 0.9,
-            "reasoning": f"The permit number {doc['permit']} does not follow the required format of 'P' followed by 4 digits.",
-            "suspicious_elements": [f"Invalid permit format: {doc['permit']}"]
-        }
+    local_judgment = _local_permit_judgment(doc)
+    if local_judgment:
+        return local_judgment
     
     # Continue with AI judgment for more complex cases where the permit is valid
     # but there might be other issues
     
     # Build a rich context for the AI to make an informed decision
-    prompt = f"""
-    {setting_context}
+    prompt = _JUDGE_TMPL.substitute(
+        setting=setting_context,
+        memory=memory_context,
+        name=doc['name'],
+        permit=doc['permit'],
+        backstory=doc['backstory']
+    )
     
-    {memory_context}
+    try:
+        response_text = await _generate_cached_text_async(
+            prompt,
+            system_type,
+            max_tokens,
+            temperature=0.7,  # Lower temperature for more consistent judgments
+            response_mime_type="application/json",
+            response_schema=JUDGMENT_SCHEMA
+        )
+        
+        # Parse the JSON response
+        response_text = response_text.strip()
+        
+        try:
+            return _finalize_judgment(_parse_json_object(response_text))
+        except json.JSONDecodeError:
+            logger.error("Failed to parse AI judgment as JSON: %s", response_text)
+        
+        return _fallback_judgment("Based on standard document verification procedures.")
+            
+    except Exception as e:
+        logger.error(f"Error in AI judgment: {e}")
+        return _fallback_judgment("Error occurred during judgment. Standard verification applied.")
+
+def ai_judge_document(doc, setting_context, memory_context, system_type="ai_judgment", max_tokens=300):
+    """
+    Use AI to judge if a document should be approved or denied.
     
-    DOCUMENT TO EVALUATE:
-    Name: {doc['name']}
-    Permit: {doc['permit']}
-    Backstory: {doc['backstory']}
+    Blocking wrapper around ai_judge_document_async.
+    """
+    return run_sync(ai_judge_document_async(doc, setting_context, memory_context, system_type, max_tokens))
+
+async def batched_turn_call_async(doc, setting_context, memory_context, max_tokens=400):
+    """
+    Get the AI judgment and a Veritas hint for a document in a single request.
     
-    Evaluate this document based on the border rules and situation.
-    Determine if this traveler should be approved or denied entry.
+    The hint is requested up front alongside the judgment so the player's
+    'hint' command needs no extra round-trip. Documents that break a basic
+    format rule are expected to be judged locally by GameplayManager before
+    this is called.
     
-    Return a valid JSON object with exactly these fields:
-    - decision: "approve" or "deny"
-    - confidence: a number between 0.0 and 1.0
-    - reasoning: a string explaining your decision
-    - suspicious_elements: a list of strings (or empty list)
+    Args:
+        doc (dict): The document to judge.
+        setting_context (str): Context about the border setting.
+        memory_context (str): Context about game history.
+        max_tokens (int): Maximum number of tokens to generate.
+        
+    Returns:
+        dict: Contains:
+            - judgment: the same structure returned by ai_judge_document
+            - hint: a Veritas hint, or None if it should be requested separately
     """
+    prompt = _TURN_TMPL.substitute(
+        setting=setting_context,
+        memory=memory_context,
+        name=doc['name'],
+        permit=doc['permit'],
+        backstory=doc['backstory']
+    )
     
     try:
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=max_tokens,
-                temperature=0.7,  # Lower temperature for more consistent judgments
-                system_instruction=system_instruction,
-                response_mime_type="application/json"
-            )
+        response_text = await _generate_cached_text_async(
+            prompt,
+            "ai_judgment",
+            max_tokens,
+            temperature=0.7,
+            response_mime_type="application/json",
+            response_schema=TURN_SCHEMA
         )
-        
-        # Parse the JSON response
-        response_text = response.text.strip()
+        response_text = response_text.strip()
         
         try:
-            # Clean the response text to ensure it's valid JSON
-            json_match = re.search(r'({.*})', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1)
-            else:
-                json_text = response_text
-                
-            judgment = json.loads(json_text)
+            data = _parse_json_object(response_text)
             
-            # Ensure required fields are present
-            required_fields = ["decision", "confidence", "reasoning", "suspicious_elements"]
-            for field in required_fields:
-                if field not in judgment:
-                    judgment[field] = "missing" if field != "confidence" else 0.5
-                    
-            # Override with a balanced probability to ensure fair gameplay
-            if random.random() < 0.3:  # 30% chance to flip the decision
-                original_decision = judgment["decision"]
-                judgment["decision"] = "deny" if original_decision == "approve" else "approve"
-                judgment["confidence"] = max(0.1, min(0.7, judgment["confidence"]))  # Lower confidence when flipping
-            
-            return judgment
+            judgment = data.get("judgment")
+            hint = data.get("hint")
+            if isinstance(judgment, dict):
+                return {
+                    "judgment": _finalize_judgment(judgment),
+                    "hint": hint.strip() if isinstance(hint, str) and hint.strip() else None
+                }
         except json.JSONDecodeError:
-            logger.error("Failed to parse AI judgment as JSON: %s", response_text)
+            pass
+        logger.error("Failed to parse batched turn response as JSON: %s", response_text)
         
-        # Fallback with balanced probability
         return {
-            "decision": "approve" if random.random() > 0.4 else "deny",  # 60% approve / 40% deny
-            "confidence": random.uniform(0.5, 0.8),
-            "reasoning": "Based on standard document verification procedures.",
-            "suspicious_elements": []
+            "judgment": _fallback_judgment("Based on standard document verification procedures."),
+            "hint": None
         }
-            
+        
     except Exception as e:
-        logger.error(f"Error in AI judgment: {e}")
-        # Fallback response with balanced probability
+        logger.error(f"Error in batched turn call: {e}")
         return {
-            "decision": "approve" if random.random() > 0.4 else "deny",
-            "confidence": random.uniform(0.5, 0.8),
-            "reasoning": "Error occurred during judgment. Standard verification applied.",
-            "suspicious_elements": []
+            "judgment": _fallback_judgment("Error occurred during judgment. Standard verification applied."),
+            "hint": None
         }
 
-def generate_narrative_update(current_state, decision, is_correct, memory_context=""):
+def batched_turn_call(doc, setting_context, memory_context, max_tokens=400):
+    """
+    Get the AI judgment and a Veritas hint for a document in a single request.
+    
+    Blocking wrapper around batched_turn_call_async.
+    """
+    return run_sync(batched_turn_call_async(doc, setting_context, memory_context, max_tokens))
+
+async def generate_narrative_update_async(current_state, decision, is_correct, memory_context=""):
     """
     Generate a narrative update based on player decisions.
     
@@ -554,29 +1193,30 @@ def generate_narrative_update(current_state, decision, is_correct, memory_contex
     corruption = current_state.get("corruption", 0)
     trust = current_state.get("trust", 0)
     
-    prompt = f"""
-    {memory_context}
-    
-    Player decision: {decision}
-    Decision correctness: {'correct' if is_correct else 'incorrect'}
-    Current corruption level: {corruption}
-    Current trust level: {trust}
-    
-    Generate a brief narrative update (1-2 sentences) describing the consequences of this decision.
-    Consider the border setting and game history in your response.
-    """
-
-    system_instruction = SYSTEM_INSTRUCTIONS.get("narrative_generation", SYSTEM_INSTRUCTIONS["narrative_generation"])
+    prompt = _NARRATIVE_TMPL.substitute(
+        memory=memory_context,
+        decision=decision,
+        correctness='correct' if is_correct else 'incorrect',
+        corruption=corruption,
+        trust=trust
+    )
 
-    response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=2000,
-                temperature=0.9,
-                system_instruction=system_instruction
+    response = await _generate_content_async(
+            prompt,
+            _build_config(
+                "narrative_generation",
+                max_output_tokens=MAX_OUTPUT_TOKENS["narrative_generation"],
+                temperature=0.9
             )
         )
         
     
     return response.text.strip()
+
+def generate_narrative_update(current_state, decision, is_correct, memory_context=""):
+    """
+    Generate a narrative update based on player decisions.
+    
+    Blocking wrapper around generate_narrative_update_async.
+    """
+    return run_sync(generate_narrative_update_async(current_state, decision, is_correct, memory_context))
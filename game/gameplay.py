@@ -5,15 +5,30 @@ Handles the core gameplay mechanics including document generation,
 verification rules, and scoring.
 """
 
+import re
 import random
 import logging
-from .api import (generate_text, generate_document_error, generate_consistent_backstory, 
-                 generate_document_for_setting, ai_judge_document)
+from .api import (generate_document_for_setting_async, generate_fast_document_async,
+                 batched_turn_call_async, get_veritas_hint, run_sync, run_in_background)
 from .memory import MemoryManager
 from .settings import SettingsManager
 
 logger = logging.getLogger(__name__)
 
+_PERMIT_RE = re.compile(r'P\d{4}')
+
+def _check_permit_prefix(doc):
+    """Check that the permit starts with 'P'."""
+    return doc["permit"].startswith("P")
+
+def _check_name_format(doc):
+    """Check that the name has both a first and a last name."""
+    return len(doc["name"].split()) >= 2
+
+def _check_permit_format(doc):
+    """Check that the permit is 'P' followed by exactly 4 digits."""
+    return _PERMIT_RE.fullmatch(doc["permit"]) is not None
+
 class Rule:
     """
     Represents a verification rule for documents.
@@ -48,10 +63,14 @@ class GameplayManager:
     """
     Manages the gameplay mechanics.
     """
-    def __init__(self):
+    def __init__(self, fast_mode=False):
         """
         Initialize the gameplay manager.
+        
+        Args:
+            fast_mode (bool): Generate traveler names locally instead of asking the AI.
         """
+        self.fast_mode = fast_mode
         self.score = 0
         self.current_document = None
         self.rules = []
@@ -59,36 +78,39 @@ class GameplayManager:
         self.settings_manager = SettingsManager()
         self._initialize_rules()
         self.ai_judgment = None  # Will store the AI's judgment of the current document
+        self.veritas_hint = None  # Hint fetched together with the judgment, if any
+        self._prefetched = None  # (setting id, future) for the next document
         self.game_completed = False  # Track if player has completed a full game
 
     def _initialize_rules(self):
         """
-        Initialize the basic verification rules.
+        Initialize the basic verification rules, cheapest check first so
+        validation can stop at the first failure.
         """
         # Rule 1: Permit must start with 'P'
         self.rules.append(
             Rule(
                 "Permit Format",
                 "All permits must start with the letter 'P'.",
-                lambda doc: doc["permit"].startswith("P")
+                _check_permit_prefix
             )
         )
         
-        # Rule 2: Permit must be followed by 4 digits
+        # Rule 2: Name must have a first and last name
         self.rules.append(
             Rule(
-                "Permit Number",
-                "Permit numbers must have 4 digits after the 'P'.",
-                lambda doc: len(doc["permit"]) == 5 and doc["permit"][1:].isdigit()
+                "Name Format",
+                "Traveler names must include both first and last names.",
+                _check_name_format
             )
         )
         
-        # Rule 3: Name must have a first and last name
+        # Rule 3: Permit must be followed by 4 digits
         self.rules.append(
             Rule(
-                "Name Format",
-                "Traveler names must include both first and last names.",
-                lambda doc: len(doc["name"].split()) >= 2
+                "Permit Number",
+                "Permit numbers must have 4 digits after the 'P'.",
+                _check_permit_format
             )
         )
 
@@ -117,6 +139,7 @@ class GameplayManager:
         self.score = 0
         self.current_document = None
         self.game_completed = False
+        self._discard_prefetched_document()
         
         # Reset memory but keep used names to prevent repetition across games
         used_names = self.memory_manager.memory["used_names"]
@@ -143,20 +166,101 @@ class GameplayManager:
         """
         Generate a new document based on the current setting.
         
+        Uses the document prefetched when the previous day ended, if it
+        belongs to the current setting.
+        
         Returns:
             dict: The generated document.
         """
-        # Get the current setting
-        setting = self.settings_manager.get_current_setting()
+        turn = self._take_prefetched_document()
+        if turn is None:
+            turn = run_sync(self._create_document_async(self._snapshot_context()))
+        return self._set_current_document(*turn)
+    
+    def prefetch_next_document(self):
+        """
+        Start generating the next document in the background.
         
-        # Get used names context to avoid repetition
-        used_names_context = self.memory_manager.get_used_names_context()
+        Called once the day has advanced and the game continues, so the next
+        document is ready by the time the player has read the day message.
+        """
+        self._discard_prefetched_document()
+        setting_id = self.settings_manager.get_current_setting()["id"]
+        future = run_in_background(self._create_document_async(self._snapshot_context()))
+        self._prefetched = (setting_id, future)
+    
+    def _take_prefetched_document(self):
+        """
+        Collect the prefetched document, if it belongs to the current setting.
         
-        # Generate a document for this setting with name history awareness
-        name, permit, backstory, additional_fields = generate_document_for_setting(
-            setting, 
-            used_names_context=used_names_context
-        )
+        Returns:
+            tuple or None: (document, judgment, hint), or None if nothing usable was prefetched.
+        """
+        if not self._prefetched:
+            return None
+        
+        setting_id, future = self._prefetched
+        self._prefetched = None
+        if setting_id != self.settings_manager.get_current_setting()["id"]:
+            future.cancel()
+            return None
+        
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Prefetching document failed: {e}")
+            return None
+    
+    def _discard_prefetched_document(self):
+        """
+        Drop a prefetched document that no longer matches the game state.
+        """
+        if self._prefetched:
+            self._prefetched[1].cancel()
+            self._prefetched = None
+    
+    def _snapshot_context(self):
+        """
+        Capture everything document generation reads from the game state, so it
+        can run in the background while the game state keeps changing.
+        
+        Returns:
+            dict: The current setting and prompt contexts.
+        """
+        return {
+            "setting": self.settings_manager.get_current_setting(),
+            "used_names": set(self.memory_manager.memory["used_names"]),
+            "used_names_context": self.memory_manager.get_used_names_context(),
+            "setting_context": self.settings_manager.get_setting_context(),
+            "memory_context": self.memory_manager.get_memory_context()
+        }
+    
+    async def _create_document_async(self, context):
+        """
+        Generate and judge a document from a context snapshot.
+        
+        Args:
+            context (dict): Snapshot from _snapshot_context.
+            
+        Returns:
+            tuple: (document, judgment, hint)
+        """
+        setting = context["setting"]
+        
+        if self.fast_mode:
+            # Name and permit are generated locally; only the backstory uses the API
+            name, permit, backstory, additional_fields = await generate_fast_document_async(
+                setting,
+                used_names=context["used_names"]
+            )
+        else:
+            # Generate the whole document (name, backstory, extra fields) in a single
+            # JSON request; the permit is generated locally
+            name, permit, backstory, additional_fields = await generate_document_for_setting_async(
+                setting, 
+                used_names_context=context["used_names_context"],
+                used_names=context["used_names"]
+            )
         
         # Create the document
         document = {
@@ -166,18 +270,58 @@ class GameplayManager:
             **additional_fields  # Include any additional fields
         }
         
-        # Use AI to judge the document
-        setting_context = self.settings_manager.get_setting_context()
-        memory_context = self.memory_manager.get_memory_context()
+        # A document that breaks a format rule is invalid no matter what the AI
+        # says, so judge it locally and skip the request
+        broken_rule = self.find_broken_rule(document)
+        if broken_rule:
+            judgment = {
+                "decision": "deny",
+                "confidence": 0.9,
+                "reasoning": f"The document breaks the {broken_rule.name} rule: {broken_rule.description}",
+                "suspicious_elements": [f"{broken_rule.name} violation"]
+            }
+            return document, judgment, None
+        
+        # Judge the document and fetch Veritas' hint in one request
+        turn = await batched_turn_call_async(document, context["setting_context"], context["memory_context"])
+        return document, turn["judgment"], turn["hint"]
+    
+    def _set_current_document(self, document, judgment, hint):
+        """
+        Make a generated document the one the player is currently reviewing.
         
-        self.ai_judgment = ai_judge_document(document, setting_context, memory_context)
+        Args:
+            document (dict): The generated document.
+            judgment (dict): The AI's judgment of the document.
+            hint (str or None): Veritas' hint, if it was fetched with the judgment.
+            
+        Returns:
+            dict: The document.
+        """
+        self.ai_judgment = judgment
+        self.veritas_hint = hint
         
         # Store the AI's judgment decision in the document
-        document["is_valid"] = self.ai_judgment["decision"] == "approve"
+        document["is_valid"] = judgment["decision"] == "approve"
         
         self.current_document = document
         return document
     
+    def find_broken_rule(self, document):
+        """
+        Find the first basic rule a document breaks.
+        
+        Args:
+            document (dict): The document to check.
+            
+        Returns:
+            Rule or None: The first failing rule, or None if all rules pass.
+        """
+        for rule in self.rules:
+            if not rule.check(document):
+                return rule
+        return None
+    
     def check_document_validity(self, document):
         """
         Check if a document is valid according to all rules.
@@ -193,10 +337,7 @@ class GameplayManager:
             return self.ai_judgment["decision"] == "approve"
         
         # Fallback to rule-based checking if no AI judgment is available
-        for rule in self.rules:
-            if not rule.check(document):
-                return False
-        return True
+        return self.find_broken_rule(document) is None
     
     def make_decision(self, decision):
         """
@@ -303,6 +444,18 @@ class GameplayManager:
         """
         return self.score
     
+    def get_veritas_hint(self):
+        """
+        Get Veritas' hint for the current document.
+        
+        Returns:
+            str: The hint, fetched from the API if it wasn't batched with the judgment.
+        """
+        if not self.veritas_hint and self.current_document:
+            memory_context = self.memory_manager.get_memory_context()
+            self.veritas_hint = get_veritas_hint(self.current_document, memory_context)
+        return self.veritas_hint
+    
     def get_ai_reasoning(self):
         """
         Get the AI's reasoning for the current judgment.
@@ -335,6 +488,8 @@ class GameplayManager:
         """
         success = self.memory_manager.load_game(filepath)
         if success:
+            self._discard_prefetched_document()
+            
             # Update score and other gameplay state from the loaded memory
             self.score = 0  # Reset score, could be calculated from decisions if needed
             
@@ -8,25 +8,18 @@ import sys
 import logging
 import argparse
 import os
-from .api import get_veritas_hint, generate_narrative_update
-from .gameplay import GameplayManager, Rule
-from .narrative import NarrativeManager
-from .ui import TerminalUI
-from .main_menu import MainMenuManager
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='veritaminal.log'
-)
 
+# Game modules are imported where they are first needed so that --help and
+# argument errors return without loading the Gemini client stack
 logger = logging.getLogger(__name__)
 
-def parse_arguments():
+def parse_arguments(argv=None):
     """
     Parse command line arguments.
     
+    Args:
+        argv (list, optional): Arguments to parse. Defaults to sys.argv[1:].
+        
     Returns:
         argparse.Namespace: Parsed arguments
     """
@@ -34,24 +27,51 @@ def parse_arguments():
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     parser.add_argument('--load', type=str, help='Load a saved game file')
     parser.add_argument('--skip-menu', action='store_true', help='Skip main menu and start game immediately')
-    return parser.parse_args()
+    parser.add_argument('--fast', action='store_true', help='Generate traveler names locally to reduce API calls')
+    return parser.parse_args(argv)
 
-def main():
+def main(args=None, gameplay_manager=None):
     """
     Main entry point for the game.
+    
+    Args:
+        args (argparse.Namespace or list, optional): Already-parsed arguments, or a list
+                                                     of arguments to parse. Defaults to sys.argv[1:].
+        gameplay_manager (GameplayManager, optional): Existing gameplay manager to run
+                                                      the game with. A new one is created if not given.
     """
-    # Parse command line arguments
-    args = parse_arguments()
+    # Parse command line arguments unless the caller already did
+    if isinstance(args, argparse.Namespace):
+        # Fill in defaults for any options the caller's parser doesn't define
+        namespace = parse_arguments([])
+        vars(namespace).update(vars(args))
+        args = namespace
+    else:
+        args = parse_arguments(args)
+    
+    # Configure logging here rather than at import so importing this module
+    # doesn't open veritaminal.log or override another entry point's setup
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            filename='veritaminal.log'
+        )
     
     # Configure logging level based on args
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    from .main_menu import MainMenuManager
+    
     # Initialize components
     logger.info("Starting Veritaminal game")
     try:
         # Initialize main menu manager
-        menu_manager = MainMenuManager()
+        menu_manager = MainMenuManager(gameplay_manager)
+        # Keep a caller's manager in its own mode unless --fast was asked for
+        if gameplay_manager is None or args.fast:
+            menu_manager.gameplay_manager.fast_mode = args.fast
         
         # Either show main menu or start game directly based on args
         if args.skip_menu:
@@ -126,6 +146,10 @@ def run_gameplay_loop(menu_manager):
     Args:
         menu_manager (MainMenuManager): The main menu manager containing gameplay components.
     """
+    from .api import generate_narrative_update
+    from .gameplay import Rule
+    from .narrative import NarrativeManager
+    
     # Create narrative manager and UI for gameplay
     gameplay_manager = menu_manager.gameplay_manager
     ui = menu_manager.ui
@@ -157,15 +181,17 @@ def run_gameplay_loop(menu_manager):
             score = gameplay_manager.score
             
             # Display completion message
-            ui.clear_screen()
-            ui.draw_border("CAREER COMPLETE")
-            print(ui.colored_text(f"You have completed your 10-day assignment!".center(ui.width), 'success'))
-            print(ui.colored_text(f"Final score: {score}".center(ui.width), 'value'))
+            ui.write_screen([
+                ui.clear_prefix(),
+                ui.border_text("CAREER COMPLETE"),
+                ui.colored_text(f"You have completed your 10-day assignment!".center(ui.width), 'success') + "\n",
+                ui.colored_text(f"Final score: {score}".center(ui.width), 'value') + "\n"
+            ])
             
             # Update career stats
             menu_manager.update_career_stats(gameplay_manager)
             
-            input("\n" + ui.colored_text("Press Enter to return to main menu...".center(ui.width), 'hint'))
+            ui.ask("\n" + ui.colored_text("Press Enter to return to main menu...".center(ui.width), 'hint'))
             break
         
         # Generate new document for current day
@@ -216,12 +242,11 @@ def run_gameplay_loop(menu_manager):
                 gameplay_manager.save_game()
                 
                 # Wait for player to continue
-                input("\nPress Enter to continue...")
+                ui.ask("\nPress Enter to continue...")
                 
             elif command == "hint":
-                # Get and display hint with memory context
-                memory_context = gameplay_manager.memory_manager.get_memory_context()
-                hint = get_veritas_hint(document, memory_context)
+                # Display the hint fetched alongside the AI judgment
+                hint = gameplay_manager.get_veritas_hint()
                 ui.display_veritas_hint(hint)
                 
             elif command == "rules":
@@ -261,8 +286,13 @@ def run_gameplay_loop(menu_manager):
             # Also advance the day in the gameplay manager
             gameplay_manager.advance_day()
             
+            # Start on the next traveler while the player reads the day message,
+            # unless this decision ended the game
+            if not gameplay_manager.game_completed and not narrative_manager.check_game_over()[0]:
+                gameplay_manager.prefetch_next_document()
+            
             print(f"\n{day_message}")
-            input("\nPress Enter to continue...")
+            ui.ask("\nPress Enter to continue...")
 
 # Keep this block to ensure it works both as a module and as a script
 if __name__ == "__main__":
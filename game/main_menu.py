@@ -6,25 +6,36 @@ Handles the main menu system, game session management, and career progression.
 
 import os
 import logging
-import glob
 from .gameplay import GameplayManager
-from .settings import SettingsManager
 from .ui import TerminalUI
 from colorama import Fore, Back, Style
 
 logger = logging.getLogger(__name__)
 
+MAIN_MENU_OPTIONS = [
+    "1. Start New Career",
+    "2. Continue Previous Career",
+    "3. View Border Settings",
+    "4. View Game Rules",
+    "5. Quit Game"
+]
+
 class MainMenuManager:
     """
     Manages the main menu and game sessions.
     """
-    def __init__(self):
+    def __init__(self, gameplay_manager=None):
         """
         Initialize the main menu manager.
+        
+        Args:
+            gameplay_manager (GameplayManager, optional): Existing gameplay manager to use.
+                                                          A new one is created if not given.
         """
         self.ui = TerminalUI()
-        self.gameplay_manager = GameplayManager()
-        self.settings_manager = SettingsManager()
+        self.gameplay_manager = gameplay_manager or GameplayManager()
+        # Share the gameplay manager's settings rather than building a second copy
+        self.settings_manager = self.gameplay_manager.settings_manager
         self.career_stats = {
             "games_completed": 0,
             "total_score": 0,
@@ -32,6 +43,40 @@ class MainMenuManager:
             "highest_day_reached": 0
         }
         
+        # Save listing is cached until the saves directory changes
+        self._saves_dir = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), 
+            self.gameplay_manager.memory_manager.save_dir
+        )
+        self._save_cache = None
+        
+        # Pre-rendered screens. Rules never change, border settings don't change
+        # during a run, and career stats only change in update_career_stats.
+        self._layout_width = None
+        self._stats_screen = ""
+        self._refresh_layout()
+    
+    def _refresh_layout(self):
+        """
+        Rebuild centered headers and cached screens if the UI width changed.
+        """
+        width = self.ui.width
+        if width == self._layout_width:
+            return
+        self._layout_width = width
+        
+        self._career_header = self.ui.colored_text("CAREER STATISTICS".center(width), 'title') + "\n"
+        self._main_menu_header = self.ui.border_text("VERITAMINAL: Document Verification Game")
+        self._main_menu_body = "".join(
+            [self.ui.colored_text("MAIN MENU".center(width), 'title') + "\n"]
+            + [self.ui.colored_text(option.center(width), 'value') + "\n" for option in MAIN_MENU_OPTIONS]
+            + ["\n" + self.ui.colored_text(self.ui.eq_rule, 'border') + "\n"]
+        )
+        
+        self._rules_screen = self._build_rules_screen()
+        self._border_screen = None
+        self._stats_screen_dirty = True
+    
     def display_main_menu(self):
         """
         Display the main menu options.
@@ -39,39 +84,20 @@ class MainMenuManager:
         Returns:
             str: The selected option.
         """
-        self.ui.clear_screen()
-        # Using UI's styled borders instead of plain text
-        self.ui.draw_border("VERITAMINAL: Document Verification Game")
+        clear = self.ui.clear_prefix()
+        self._refresh_layout()
         
         # Display career stats if any games have been played
-        if self.career_stats["games_completed"] > 0:
-            print(self.ui.colored_text("CAREER STATISTICS".center(self.ui.width), 'title'))
-            print(self.ui.colored_text(f"Games Completed: {self.career_stats['games_completed']}", 'value'))
-            print(self.ui.colored_text(f"Total Career Score: {self.career_stats['total_score']}", 'value'))
-            print(self.ui.colored_text(f"Borders Served: {len(self.career_stats['borders_served'])}", 'value'))
-            print(self.ui.colored_text(f"Highest Day Reached: {self.career_stats['highest_day_reached']}", 'value'))
-            print("\n" + self.ui.colored_text("=" * self.ui.width, 'border') + "\n")
-        
-        print(self.ui.colored_text("MAIN MENU".center(self.ui.width), 'title'))
-        options = [
-            "1. Start New Career",
-            "2. Continue Previous Career",
-            "3. View Border Settings",
-            "4. View Game Rules",
-            "5. Quit Game"
-        ]
+        if self._stats_screen_dirty:
+            self._stats_screen = self._build_stats_screen()
+            self._stats_screen_dirty = False
         
-        for option in options:
-            print(self.ui.colored_text(option.center(self.ui.width), 'value'))
-            
-        print("\n" + self.ui.colored_text("=" * self.ui.width, 'border'))
+        self.ui.write_screen([clear, self._main_menu_header, self._stats_screen, self._main_menu_body])
         
-        choice = ""
-        valid_choices = ["1", "2", "3", "4", "5"]
-        while choice not in valid_choices:
-            choice = input("\n" + self.ui.colored_text("Enter your selection (1-5): ", 'hint'))
-            
-        return choice
+        return self.ui.read_choice(
+            "\n" + self.ui.colored_text("Enter your selection (1-5): ", 'hint'),
+            ["1", "2", "3", "4", "5"]
+        )
     
     def start_new_career(self):
         """
@@ -81,23 +107,21 @@ class MainMenuManager:
             bool: True if a game was started, False otherwise.
         """
         # Display available border settings
-        self.ui.clear_screen()
-        self.ui.draw_border("SELECT YOUR BORDER ASSIGNMENT")
+        parts = [self.ui.clear_prefix(), self.ui.border_text("SELECT YOUR BORDER ASSIGNMENT")]
         
         settings = self.settings_manager.get_available_settings()
         for i, setting in enumerate(settings, 1):
-            print(self.ui.colored_text(f"{i}. {setting['name']}", 'header'))
-            print(self.ui.colored_text(f"   {setting['description']}\n", 'value'))
+            parts.append(self.ui.colored_text(f"{i}. {setting['name']}", 'header') + "\n")
+            parts.append(self.ui.colored_text(f"   {setting['description']}\n", 'value') + "\n")
         
         # Let player choose a border or go back to main menu
-        print(self.ui.colored_text("0. Return to Main Menu", 'command'))
-        
-        choice = -1
-        while choice < 0 or choice > len(settings):
-            try:
-                choice = int(input("\n" + self.ui.colored_text(f"Enter your choice (0-{len(settings)}): ", 'hint')))
-            except ValueError:
-                print(self.ui.colored_text("Please enter a valid number.", 'error'))
+        parts.append(self.ui.colored_text("0. Return to Main Menu", 'command') + "\n")
+        self.ui.write_screen(parts)
+        
+        choice = int(self.ui.read_choice(
+            "\n" + self.ui.colored_text(f"Enter your choice (0-{len(settings)}): ", 'hint'),
+            {str(i) for i in range(len(settings) + 1)}
+        ))
                 
         if choice == 0:
             return False  # Return to main menu
@@ -105,14 +129,17 @@ class MainMenuManager:
         # Initialize new game with selected border
         selected_setting = self.gameplay_manager.initialize_game(settings[choice-1]["id"])
         
-        self.ui.clear_screen()
-        print(self.ui.colored_text(f"\nYou selected: {selected_setting['name']}", 'header'))
-        print(self.ui.colored_text(f"\n{selected_setting['description']}\n", 'value'))
-        print(self.ui.colored_text("Current rules:", 'header'))
+        parts = [
+            self.ui.clear_prefix(),
+            self.ui.colored_text(f"\nYou selected: {selected_setting['name']}", 'header') + "\n",
+            self.ui.colored_text(f"\n{selected_setting['description']}\n", 'value') + "\n",
+            self.ui.colored_text("Current rules:", 'header') + "\n"
+        ]
         for rule in self.gameplay_manager.settings_manager.get_all_rules():
-            print(self.ui.colored_text(f"- {rule}", 'value'))
+            parts.append(self.ui.colored_text(f"- {rule}", 'value') + "\n")
+        self.ui.write_screen(parts)
         
-        input("\n" + self.ui.colored_text("Press Enter to begin your shift...", 'hint'))
+        self.ui.ask("\n" + self.ui.colored_text("Press Enter to begin your shift...", 'hint'))
         return True
     
     def continue_previous_career(self):
@@ -122,29 +149,28 @@ class MainMenuManager:
         Returns:
             bool: True if a game was loaded, False otherwise.
         """
-        self.ui.clear_screen()
-        self.ui.draw_border("LOAD PREVIOUS CAREER")
+        parts = [self.ui.clear_prefix(), self.ui.border_text("LOAD PREVIOUS CAREER")]
         
         # Get list of save files
         save_files = self._get_save_files()
         
         if not save_files:
-            print(self.ui.colored_text("No saved games found.", 'error'))
-            input("\n" + self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
+            parts.append(self.ui.colored_text("No saved games found.", 'error') + "\n")
+            self.ui.write_screen(parts)
+            self.ui.ask("\n" + self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
             return False
         
-        print(self.ui.colored_text("Available saved games:", 'header'))
+        parts.append(self.ui.colored_text("Available saved games:", 'header') + "\n")
         for i, (save_path, save_name) in enumerate(save_files, 1):
-            print(self.ui.colored_text(f"{i}. {save_name}", 'value'))
+            parts.append(self.ui.colored_text(f"{i}. {save_name}", 'value') + "\n")
         
-        print("\n" + self.ui.colored_text("0. Return to Main Menu", 'command'))
+        parts.append("\n" + self.ui.colored_text("0. Return to Main Menu", 'command') + "\n")
+        self.ui.write_screen(parts)
         
-        choice = -1
-        while choice < 0 or choice > len(save_files):
-            try:
-                choice = int(input("\n" + self.ui.colored_text(f"Enter your choice (0-{len(save_files)}): ", 'hint')))
-            except ValueError:
-                print(self.ui.colored_text("Please enter a valid number.", 'error'))
+        choice = int(self.ui.read_choice(
+            "\n" + self.ui.colored_text(f"Enter your choice (0-{len(save_files)}): ", 'hint'),
+            {str(i) for i in range(len(save_files) + 1)}
+        ))
                 
         if choice == 0:
             return False  # Return to main menu
@@ -154,20 +180,21 @@ class MainMenuManager:
         success = self.gameplay_manager.load_game(save_path)
         
         if success:
-            print(self.ui.colored_text(f"\nGame loaded successfully!", 'success'))
-            
             # Display border info
             setting = self.gameplay_manager.settings_manager.get_current_setting()
             day = self.gameplay_manager.memory_manager.memory["game_state"]["day"]
             
-            print(self.ui.colored_text(f"\nCurrent Assignment: {setting['name']}", 'header'))
-            print(self.ui.colored_text(f"Current Day: {day}", 'value'))
+            self.ui.write_screen([
+                self.ui.colored_text(f"\nGame loaded successfully!", 'success') + "\n",
+                self.ui.colored_text(f"\nCurrent Assignment: {setting['name']}", 'header') + "\n",
+                self.ui.colored_text(f"Current Day: {day}", 'value') + "\n"
+            ])
             
-            input("\n" + self.ui.colored_text("Press Enter to continue your shift...", 'hint'))
+            self.ui.ask("\n" + self.ui.colored_text("Press Enter to continue your shift...", 'hint'))
             return True
         else:
             print(self.ui.colored_text("\nFailed to load game.", 'error'))
-            input("\n" + self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
+            self.ui.ask("\n" + self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
             return False
     
     def view_border_settings(self):
@@ -177,38 +204,82 @@ class MainMenuManager:
         Returns:
             bool: Always False to return to main menu.
         """
-        self.ui.clear_screen()
-        self.ui.draw_border("BORDER SETTINGS")
+        clear = self.ui.clear_prefix()
+        self._refresh_layout()
+        if self._border_screen is None:
+            self._border_screen = self._build_border_screen()
+        self.ui.write_screen([clear, self._border_screen])
+        
+        self.ui.ask(self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
+        return False
+    
+    def view_game_rules(self):
+        """
+        Display the core game rules.
+        
+        Returns:
+            bool: Always False to return to main menu.
+        """
+        clear = self.ui.clear_prefix()
+        self._refresh_layout()
+        self.ui.write_screen([clear, self._rules_screen])
+        self.ui.ask("\n" + self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
+        return False
+    
+    def _build_stats_screen(self):
+        """
+        Render the career statistics block of the main menu.
+        
+        Returns:
+            str: The rendered block, or an empty string before any game is completed.
+        """
+        if self.career_stats["games_completed"] == 0:
+            return ""
+        
+        return "".join([
+            self._career_header,
+            self.ui.colored_text(f"Games Completed: {self.career_stats['games_completed']}", 'value') + "\n",
+            self.ui.colored_text(f"Total Career Score: {self.career_stats['total_score']}", 'value') + "\n",
+            self.ui.colored_text(f"Borders Served: {len(self.career_stats['borders_served'])}", 'value') + "\n",
+            self.ui.colored_text(f"Highest Day Reached: {self.career_stats['highest_day_reached']}", 'value') + "\n",
+            "\n" + self.ui.colored_text(self.ui.eq_rule, 'border') + "\n\n"
+        ])
+    
+    def _build_border_screen(self):
+        """
+        Render the border settings screen.
+        
+        Returns:
+            str: The rendered screen.
+        """
+        parts = [self.ui.border_text("BORDER SETTINGS")]
         
         settings = self.settings_manager.get_available_settings()
         
         for setting in settings:
-            print(self.ui.colored_text(f"= {setting['name']} =".center(self.ui.width), 'title'))
-            print(self.ui.colored_text(f"\n{setting['description']}", 'value'))
-            print(self.ui.colored_text(f"\nSituation: {setting['situation']}", 'value'))
+            parts.append(self.ui.colored_text(f"= {setting['name']} =".center(self.ui.width), 'title') + "\n")
+            parts.append(self.ui.colored_text(f"\n{setting['description']}", 'value') + "\n")
+            parts.append(self.ui.colored_text(f"\nSituation: {setting['situation']}", 'value') + "\n")
             
-            print(self.ui.colored_text("\nDocument Requirements:", 'header'))
+            parts.append(self.ui.colored_text("\nDocument Requirements:", 'header') + "\n")
             for req in setting['document_requirements']:
-                print(self.ui.colored_text(f"- {req}", 'value'))
+                parts.append(self.ui.colored_text(f"- {req}", 'value') + "\n")
                 
-            print(self.ui.colored_text("\nCommon Issues:", 'header'))
+            parts.append(self.ui.colored_text("\nCommon Issues:", 'header') + "\n")
             for issue in setting['common_issues']:
-                print(self.ui.colored_text(f"- {issue}", 'value'))
+                parts.append(self.ui.colored_text(f"- {issue}", 'value') + "\n")
                 
-            print("\n" + self.ui.colored_text("=" * self.ui.width, 'border') + "\n")
-        
-        input(self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
-        return False
+            parts.append("\n" + self.ui.colored_text(self.ui.eq_rule, 'border') + "\n\n")
+        return "".join(parts)
     
-    def view_game_rules(self):
+    def _build_rules_screen(self):
         """
-        Display the core game rules.
+        Render the game rules screen.
         
         Returns:
-            bool: Always False to return to main menu.
+            str: The rendered screen.
         """
-        self.ui.clear_screen()
-        self.ui.draw_border("GAME RULES")
+        parts = [self.ui.border_text("GAME RULES")]
         
         rules = [
             "As a border control agent, your job is to verify travel documents.",
@@ -224,10 +295,10 @@ class MainMenuManager:
         ]
         
         for rule in rules:
-            print(self.ui.colored_text(f"• {rule}", 'value'))
+            parts.append(self.ui.colored_text(f"• {rule}", 'value') + "\n")
         
-        print("\n" + self.ui.colored_text("=" * self.ui.width, 'border'))
-        print(self.ui.colored_text("\nCommands during gameplay:".center(self.ui.width), 'header'))
+        parts.append("\n" + self.ui.colored_text(self.ui.eq_rule, 'border') + "\n")
+        parts.append(self.ui.colored_text("\nCommands during gameplay:".center(self.ui.width), 'header') + "\n")
         commands = [
             ("approve", "Approve the current traveler"),
             ("deny", "Deny the current traveler"),
@@ -239,11 +310,10 @@ class MainMenuManager:
         ]
         
         for cmd, desc in commands:
-            print(f"{self.ui.colored_text(cmd.ljust(10), 'command')} - {self.ui.colored_text(desc, 'value')}")
+            parts.append(f"{self.ui.colored_text(cmd.ljust(10), 'command')} - {self.ui.colored_text(desc, 'value')}\n")
             
-        print("\n" + self.ui.colored_text("=" * self.ui.width, 'border'))
-        input("\n" + self.ui.colored_text("Press Enter to return to main menu...", 'hint'))
-        return False
+        parts.append("\n" + self.ui.colored_text(self.ui.eq_rule, 'border') + "\n")
+        return "".join(parts)
     
     def update_career_stats(self, gameplay_manager):
         """
@@ -266,23 +336,33 @@ class MainMenuManager:
             self.career_stats["highest_day_reached"],
             day
         )
+        self._stats_screen_dirty = True
     
     def _get_save_files(self):
         """
         Get list of available save files.
         
         Returns:
-            list: List of (path, name) tuples for save files.
+            list: List of (path, name) tuples for save files, newest first.
         """
-        # Get the saves directory path
-        saves_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            self.gameplay_manager.memory_manager.save_dir
-        )
-        
-        # Get all JSON files in the saves directory
-        save_pattern = os.path.join(saves_dir, "*.json")
-        save_files = glob.glob(save_pattern)
-        
-        # Convert to (path, name) tuples
-        return [(path, os.path.basename(path)) for path in save_files]
\ No newline at end of file
+        try:
+            dir_mtime = os.stat(self._saves_dir).st_mtime_ns
+        except OSError:
+            return []
+        
+        # Adding, removing or renaming a save updates the directory mtime
+        if self._save_cache and self._save_cache[0] == dir_mtime:
+            return self._save_cache[1]
+        
+        # Get all JSON files in the saves directory in one directory scan
+        with os.scandir(self._saves_dir) as it:
+            entries = [
+                (entry.stat().st_mtime_ns, entry.path, entry.name)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        entries.sort(reverse=True)
+        
+        save_files = [(path, name) for _, path, name in entries]
+        self._save_cache = (dir_mtime, save_files)
+        return save_files
\ No newline at end of file
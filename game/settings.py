@@ -177,21 +177,22 @@ class SettingsManager:
         if not self.current_setting:
             self.current_setting = self.available_settings[0]
             
-        self.ui.clear_screen()
-        self.ui.draw_border(f"BORDER: {self.current_setting['name']}")
-        
-        print(self.ui.colored_text(f"SITUATION:", 'header'))
-        print(self.ui.colored_text(f"{self.current_setting['situation']}\n", 'value'))
-        
-        print(self.ui.colored_text("DOCUMENT REQUIREMENTS:", 'header'))
+        parts = [
+            self.ui.clear_prefix(),
+            self.ui.border_text(f"BORDER: {self.current_setting['name']}"),
+            self.ui.colored_text(f"SITUATION:", 'header') + "\n",
+            self.ui.colored_text(f"{self.current_setting['situation']}\n", 'value') + "\n",
+            self.ui.colored_text("DOCUMENT REQUIREMENTS:", 'header') + "\n"
+        ]
         for req in self.current_setting["document_requirements"]:
-            print(self.ui.colored_text(f"- {req}", 'value'))
+            parts.append(self.ui.colored_text(f"- {req}", 'value') + "\n")
         
-        print(self.ui.colored_text("\nCOMMON ISSUES:", 'header'))
+        parts.append(self.ui.colored_text("\nCOMMON ISSUES:", 'header') + "\n")
         for issue in self.current_setting["common_issues"]:
-            print(self.ui.colored_text(f"- {issue}", 'value'))
+            parts.append(self.ui.colored_text(f"- {issue}", 'value') + "\n")
             
         if self.custom_rules:
-            print(self.ui.colored_text("\nADDITIONAL RULES:", 'header'))
+            parts.append(self.ui.colored_text("\nADDITIONAL RULES:", 'header') + "\n")
             for rule in self.custom_rules:
-                print(self.ui.colored_text(f"- {rule}", 'value'))
\ No newline at end of file
+                parts.append(self.ui.colored_text(f"- {rule}", 'value') + "\n")
+        self.ui.write_screen(parts)
\ No newline at end of file
@@ -7,19 +7,34 @@ user input, and interface styling.
 
 import os
 import sys
+import shutil
 import logging
-from prompt_toolkit import prompt
-from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit import PromptSession
+from prompt_toolkit.formatted_text import ANSI, HTML
 from prompt_toolkit.styles import Style
-from prompt_toolkit.completion import WordCompleter
-from colorama import init, Fore, Back, Style as ColoramaStyle
+from prompt_toolkit.completion import Completer, Completion, DynamicCompleter
+from colorama import just_fix_windows_console, Fore, Back, Style as ColoramaStyle
 
-# Initialize colorama for cross-platform terminal colors
-# Using settings that worked well in testing
-init(autoreset=True, convert=True, strip=False, wrap=True)
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import termios
+    import tty
+
+# Enable ANSI colors on Windows consoles (native VT mode on Windows 10+, a
+# converting wrapper only on older consoles). Elsewhere stdout is left unwrapped.
+just_fix_windows_console()
 
 logger = logging.getLogger(__name__)
 
+# Document keys shown in the main section or never shown at all
+_CORE_DOCUMENT_FIELDS = {'name', 'permit', 'backstory', 'is_valid'}
+
+# Clear the screen and move the cursor to the top-left corner.
+# colorama translates this for legacy Windows consoles.
+_CLEAR = "\x1b[2J\x1b[H"
+
 # Define color styles for prompt_toolkit
 pt_style = Style.from_dict({
     'title': '#ansiyellow bold',
@@ -34,8 +49,161 @@ pt_style = Style.from_dict({
     'border_info': '#ansiyellow italic',
 })
 
+WELCOME_TEXT = [
+    "Welcome to the border checkpoint.",
+    "",
+    "As a border control agent, your job is to verify travelers' documents",
+    "and decide whether to approve or deny their entry.",
+    "",
+    "You'll be assisted by Veritas, an AI that may provide hints.",
+    "Your decisions will have consequences that carry through your career.",
+    "",
+    "Type 'help' for a list of commands.",
+]
+
+# Closing line and style for each ending type
+ENDINGS = {
+    'good': ("Congratulations! You've successfully completed your mission.", 'success'),
+    'corrupt': ("Your corruption has caught up with you.", 'error'),
+    'strict': ("Your strict adherence to rules has made you unpopular.", 'warning'),
+    'bad': ("Your career has come to an unfortunate end.", 'error'),
+}
+DEFAULT_ENDING = ("Your career has come to an unfortunate end.", 'normal')
+
+# Define color styles for terminal output based on test results (Option 3)
+COLORS = {
+    'title': Fore.YELLOW + Back.BLUE,  # Yellow on blue for titles
+    'header': Fore.BLUE,
+    'normal': Fore.WHITE,
+    'error': Fore.RED,
+    'success': Fore.GREEN,
+    'warning': Fore.YELLOW,
+    'hint': Fore.CYAN,
+    'command': Fore.MAGENTA,
+    'veritas': Fore.GREEN,
+    'border_info': Fore.YELLOW,
+    'border': Fore.BLUE,
+    'key': Fore.CYAN,
+    'value': Fore.WHITE,
+    'reset': ColoramaStyle.RESET_ALL,
+}
+
+# Add special combinations for emphasis using background colors instead of brightness
+EMPHASIS = {
+    'title': Back.BLACK,       # Yellow on black for titles
+    'key': Back.BLACK,         # Cyan on black for keys
+    'veritas': Back.BLACK,     # Green on black for Veritas
+    'error': Back.BLACK,       # Red on black for errors
+    'success': Back.BLACK,     # Green on black for success
+}
+
+def _colorize(text, style_name):
+    """
+    Return text with the specified color style.
+    
+    Args:
+        text (str): Text to color.
+        style_name (str): Name of the style to apply.
+        
+    Returns:
+        str: Colored text.
+    """
+    if style_name not in COLORS:
+        return text
+        
+    # Apply background emphasis for specific styles that would normally use BRIGHT
+    if style_name in EMPHASIS:
+        return f"{COLORS[style_name]}{EMPHASIS[style_name]}{text}{COLORS['reset']}"
+        
+    return f"{COLORS[style_name]}{text}{COLORS['reset']}"
+
+HELP_COMMANDS = [
+    ("approve", "Approve the current traveler"),
+    ("deny", "Deny the current traveler"),
+    ("hint", "Request a hint from Veritas"),
+    ("rules", "Display current verification rules"),
+    ("save", "Save your current game progress"),
+    ("help", "Show this help information"),
+    ("quit", "Exit the game")
+]
+
+# The command table doesn't depend on the terminal width, so render it once
+_HELP_BODY = "".join(
+    f"{_colorize(cmd.ljust(10), 'command')} - {_colorize(desc, 'normal')}\n"
+    for cmd, desc in HELP_COMMANDS
+)
+
+class CommandCompleter(Completer):
+    """
+    Completes game commands, looking candidates up by their first letter.
+    """
+    def __init__(self, commands):
+        """
+        Initialize the completer.
+        
+        Args:
+            commands (list): Commands to complete.
+        """
+        self.commands = list(commands)
+        self._by_first_letter = {}
+        for command in self.commands:
+            self._by_first_letter.setdefault(command[0], []).append(command)
+    
+    def get_completions(self, document, complete_event):
+        """
+        Yield the commands that start with the word before the cursor.
+        
+        Args:
+            document (Document): The current input buffer contents.
+            complete_event (CompleteEvent): Event that triggered the completion.
+            
+        Yields:
+            Completion: Matching commands.
+        """
+        word = document.get_word_before_cursor()
+        candidates = self._by_first_letter.get(word[0], ()) if word else self.commands
+        for command in candidates:
+            if command.startswith(word):
+                yield Completion(command, start_position=-len(word))
+
 # Command completer for auto-completion
-command_completer = WordCompleter(['approve', 'deny', 'hint', 'rules', 'help', 'save', 'quit'])
+command_completer = CommandCompleter(['approve', 'deny', 'hint', 'rules', 'help', 'save', 'quit'])
+
+
+def _read_key():
+    """
+    Read a single key press from the terminal without waiting for Enter.
+    
+    Anything typed along with the key (such as the Enter players press out of
+    habit) is discarded, so it can't answer the next prompt.
+    
+    Returns:
+        str: The character that was typed.
+        
+    Raises:
+        EOFError: If stdin was closed.
+    """
+    if msvcrt:
+        key = msvcrt.getwch()
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+        if key == '\x03':
+            raise KeyboardInterrupt
+        return key
+    
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        # cbreak keeps signal handling, so Ctrl+C still raises KeyboardInterrupt
+        tty.setcbreak(fd)
+        key = sys.stdin.read(1)
+        termios.tcflush(fd, termios.TCIFLUSH)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    
+    if not key:
+        raise EOFError
+    return key
 
 
 class TerminalUI:
@@ -47,34 +215,16 @@ class TerminalUI:
         Initialize the terminal UI.
         """
         self.width = 80  # Default width
+        self._block_cache = None  # Built by adjust_terminal_size
         self.adjust_terminal_size()
         
-        # Define color styles for terminal output based on test results (Option 3)
-        self.colors = {
-            'title': Fore.YELLOW + Back.BLUE,  # Yellow on blue for titles
-            'header': Fore.BLUE,
-            'normal': Fore.WHITE,
-            'error': Fore.RED,
-            'success': Fore.GREEN,
-            'warning': Fore.YELLOW,
-            'hint': Fore.CYAN,
-            'command': Fore.MAGENTA,
-            'veritas': Fore.GREEN,
-            'border_info': Fore.YELLOW,
-            'border': Fore.BLUE,
-            'key': Fore.CYAN,
-            'value': Fore.WHITE,
-            'reset': ColoramaStyle.RESET_ALL,
-        }
-        
-        # Add special combinations for emphasis using background colors instead of brightness
-        self.emphasis = {
-            'title': Back.BLACK,       # Yellow on black for titles
-            'key': Back.BLACK,         # Cyan on black for keys
-            'veritas': Back.BLACK,     # Green on black for Veritas
-            'error': Back.BLACK,       # Red on black for errors
-            'success': Back.BLACK,     # Green on black for success
-        }
+        self.colors = COLORS
+        self.emphasis = EMPHASIS
+        
+        # One prompt_toolkit session serves every prompt so the terminal isn't
+        # reconfigured between screens; created on first use
+        self._session = None
+        self._active_completer = None
 
     def _check_color_support(self):
         """
@@ -101,20 +251,63 @@ class TerminalUI:
     def adjust_terminal_size(self):
         """
         Adjust UI based on terminal size.
+        
+        Cheap to call before every screen: the size query is a single ioctl,
+        and the rulers and cached blocks are only rebuilt when the width changes.
         """
-        try:
-            # Get terminal size if available
-            terminal_size = os.get_terminal_size()
-            self.width = min(100, terminal_size.columns)
-        except (AttributeError, OSError):
-            # Default if terminal size can't be determined
-            self.width = 80
+        # Falls back to 80 columns if the terminal size can't be determined
+        width = min(100, shutil.get_terminal_size((80, 24)).columns)
+        if width == self.width and self._block_cache is not None:
+            return
+        self.width = width
+        
+        # Rulers used by every screen, rebuilt only when the width changes
+        self.eq_rule = "=" * self.width
+        self.dash_rule = "-" * self.width
+        
+        # Static screen blocks depend on the width, so render them again lazily
+        self._block_cache = {}
+    
+    def _cached_block(self, key, build):
+        """
+        Return a rendered static block, building it on first use at the current width.
+        
+        Args:
+            key: Cache key for the block.
+            build (callable): Function that renders the block.
+            
+        Returns:
+            str: The rendered block.
+        """
+        block = self._block_cache.get(key)
+        if block is None:
+            block = self._block_cache[key] = build()
+        return block
+    
+    def clear_prefix(self):
+        """
+        Prepare a new screen and return the escape sequence that clears it.
+        
+        Screens put the result in front of their first write_screen() call, so
+        the clear and the first render reach the terminal together and the
+        blank frame in between never shows.
+        
+        Returns:
+            str: The clear sequence, or "" if the screen was cleared externally.
+        """
+        # Every screen starts here, so pick up any terminal resize first
+        self.adjust_terminal_size()
+        if sys.stdout.isatty() and os.environ.get('TERM') != 'dumb':
+            return _CLEAR
+        os.system('cls' if os.name == 'nt' else 'clear')
+        return ""
     
     def clear_screen(self):
         """
         Clear the terminal screen.
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(self.clear_prefix())
+        sys.stdout.flush()
     
     def colored_text(self, text, style_name):
         """
@@ -127,14 +320,82 @@ class TerminalUI:
         Returns:
             str: Colored text.
         """
-        if style_name not in self.colors:
-            return text
+        return _colorize(text, style_name)
+    
+    def read_choice(self, prompt_text, valid_choices):
+        """
+        Read a menu selection, reacting to a single key press when possible.
+        
+        Falls back to line input when stdin isn't a terminal or when a choice
+        takes more than one key (e.g. menus with 10 or more entries).
+        
+        Args:
+            prompt_text (str): Prompt to display.
+            valid_choices (iterable): Accepted selections as strings.
             
-        # Apply background emphasis for specific styles that would normally use BRIGHT
-        if style_name in self.emphasis:
-            return f"{self.colors[style_name]}{self.emphasis[style_name]}{text}{self.colors['reset']}"
+        Returns:
+            str: The selected choice.
+        """
+        valid_choices = set(valid_choices)
+        
+        if not sys.stdin.isatty() or any(len(choice) != 1 for choice in valid_choices):
+            while True:
+                choice = self.ask(prompt_text).strip()
+                if choice in valid_choices:
+                    return choice
+                if choice:
+                    self.colored_print("Please enter a valid choice.", 'error')
+        
+        sys.stdout.write(prompt_text)
+        sys.stdout.flush()
+        while True:
+            key = _read_key()
+            if key in valid_choices:
+                # Echo the selection so the screen reads as if it had been typed
+                sys.stdout.write(key + "\n")
+                sys.stdout.flush()
+                return key
+    
+    def _get_session(self):
+        """
+        Get the shared prompt session, creating it on first use.
+        
+        Returns:
+            PromptSession: The prompt session.
+        """
+        if self._session is None:
+            self._session = PromptSession(
+                style=pt_style,
+                completer=DynamicCompleter(lambda: self._active_completer)
+            )
+        return self._session
+    
+    def ask(self, prompt_text):
+        """
+        Read a line of input through the shared prompt session.
+        
+        Args:
+            prompt_text (str): Prompt to display; may contain color codes.
             
-        return f"{self.colors[style_name]}{text}{self.colors['reset']}"
+        Returns:
+            str: The line entered by the user.
+        """
+        # prompt_toolkit needs a terminal; piped input is read directly
+        if not sys.stdin.isatty():
+            return input(prompt_text)
+        
+        self._active_completer = None
+        return self._get_session().prompt(ANSI(prompt_text))
+    
+    def write_screen(self, parts):
+        """
+        Write a whole screen to the terminal in a single call.
+        
+        Args:
+            parts (list): Text fragments making up the screen.
+        """
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def colored_print(self, text, style_name='normal'):
         """
@@ -146,47 +407,56 @@ class TerminalUI:
         """
         print(self.colored_text(text, style_name))
     
-    def draw_border(self, title=None):
+    def border_text(self, title=None):
         """
-        Draw a border with an optional title.
+        Build the text of a border with an optional title.
         
         Args:
             title (str, optional): Title to display in the border.
+            
+        Returns:
+            str: The border text, ending with a newline.
         """
-        border = "=" * self.width  # Using '=' instead of '-' for borders
-        print(self.colored_text("\n" + border, 'border'))
+        border = self.eq_rule  # Using '=' instead of '-' for borders
+        text = self.colored_text("\n" + border, 'border') + "\n"
         
         if title:
-            print(self.colored_text(title.center(self.width), 'title'))
-            print(self.colored_text(border + "\n", 'border'))
+            text += self.colored_text(title.center(self.width), 'title') + "\n"
+            text += self.colored_text(border + "\n", 'border') + "\n"
         else:
-            print()
+            text += "\n"
+        return text
+    
+    def draw_border(self, title=None):
+        """
+        Draw a border with an optional title.
+        
+        Args:
+            title (str, optional): Title to display in the border.
+        """
+        sys.stdout.write(self.border_text(title))
     
     def display_welcome(self):
         """
         Display the welcome message.
         """
-        self.clear_screen()
-        self.draw_border("VERITAMINAL: Document Verification Game")
-        
-        welcome_text = [
-            "Welcome to the border checkpoint.",
-            "",
-            "As a border control agent, your job is to verify travelers' documents",
-            "and decide whether to approve or deny their entry.",
-            "",
-            "You'll be assisted by Veritas, an AI that may provide hints.",
-            "Your decisions will have consequences that carry through your career.",
-            "",
-            "Type 'help' for a list of commands.",
-        ]
+        clear = self.clear_prefix()
+        self.write_screen([clear, self._cached_block('welcome', self._build_welcome_block)])
         
-        for line in welcome_text:
-            print(self.colored_text(line.center(self.width), 'normal'))
-        
-        print("\n" + self.colored_text("=" * self.width, 'border') + "\n")
+        self.ask(self.colored_text("Press Enter to begin...".center(self.width), 'hint'))
+    
+    def _build_welcome_block(self):
+        """
+        Render the welcome screen.
         
-        input(self.colored_text("Press Enter to begin...".center(self.width), 'hint'))
+        Returns:
+            str: The rendered screen.
+        """
+        return "".join(
+            [self.border_text("VERITAMINAL: Document Verification Game")]
+            + [self.colored_text(line.center(self.width), 'normal') + "\n" for line in WELCOME_TEXT]
+            + ["\n" + self.colored_text(self.eq_rule, 'border') + "\n\n"]
+        )
     
     def display_border_selection(self, settings):
         """
@@ -198,21 +468,17 @@ class TerminalUI:
         Returns:
             int: The selected border setting index.
         """
-        self.clear_screen()
-        self.draw_border("SELECT YOUR BORDER ASSIGNMENT")
+        parts = [self.clear_prefix(), self.border_text("SELECT YOUR BORDER ASSIGNMENT")]
         
         for i, setting in enumerate(settings, 1):
-            print(self.colored_text(f"{i}. {setting['name']}", 'header'))
-            print(self.colored_text(f"   {setting['description']}\n", 'normal'))
-        
-        choice = 0
-        while choice < 1 or choice > len(settings):
-            try:
-                choice = int(input(self.colored_text(f"\nEnter your choice (1-{len(settings)}): ", 'hint')))
-            except ValueError:
-                self.colored_print("Please enter a valid number.", 'error')
-                
-        return choice
+            parts.append(self.colored_text(f"{i}. {setting['name']}", 'header') + "\n")
+            parts.append(self.colored_text(f"   {setting['description']}\n", 'normal') + "\n")
+        self.write_screen(parts)
+        
+        # Valid answers are checked by set membership rather than int() and ValueError;
+        # up to nine borders this takes a single key press
+        prompt_str = self.colored_text(f"\nEnter your choice (1-{len(settings)}): ", 'hint')
+        return int(self.read_choice(prompt_str, {str(i) for i in range(1, len(settings) + 1)}))
     
     def display_document(self, document):
         """
@@ -221,31 +487,36 @@ class TerminalUI:
         Args:
             document (dict): The document to display.
         """
-        self.clear_screen()
+        clear = self.clear_prefix()
         # Using '=' instead of '-' for borders as in Option 3
-        print(self.colored_text("\n" + "=" * self.width, 'border'))
-        print(self.colored_text("TRAVELER DOCUMENT".center(self.width), 'title'))
-        print(self.colored_text("=" * self.width + "\n", 'border'))
-        
-        # Display document details with formatting
-        print(f"{self.colored_text('Name:', 'key')}      {self.colored_text(document['name'], 'value')}")
-        print(f"{self.colored_text('Permit:', 'key')}    {self.colored_text(document['permit'], 'value')}")
-        print(f"\n{self.colored_text('Backstory:', 'key')} {self.colored_text(document['backstory'], 'value')}")
+        parts = [
+            clear,
+            self.colored_text("\n" + self.eq_rule, 'border') + "\n",
+            self.colored_text("TRAVELER DOCUMENT".center(self.width), 'title') + "\n",
+            self.colored_text(self.eq_rule + "\n", 'border') + "\n",
+            # Display document details with formatting
+            f"{self.colored_text('Name:', 'key')}      {self.colored_text(document['name'], 'value')}\n",
+            f"{self.colored_text('Permit:', 'key')}    {self.colored_text(document['permit'], 'value')}\n",
+            f"\n{self.colored_text('Backstory:', 'key')} {self.colored_text(document['backstory'], 'value')}\n"
+        ]
         
         # Display any additional fields that may be present
         additional_fields = [key for key in document.keys() 
-                           if key not in ('name', 'permit', 'backstory', 'is_valid')]
+                           if key not in _CORE_DOCUMENT_FIELDS]
         if additional_fields:
-            print(self.colored_text("\nAdditional Information:", 'header'))
+            parts.append(self.colored_text("\nAdditional Information:", 'header') + "\n")
             for field in additional_fields:
                 if isinstance(document[field], dict):
-                    print(self.colored_text(f"{field.capitalize()}: ", 'key'))
-                    for subkey, value in document[field].items():
-                        print(f"  - {self.colored_text(subkey.capitalize() + ':', 'key')} {self.colored_text(value, 'value')}")
+                    parts.append(self.colored_text(f"{field.capitalize()}: ", 'key') + "\n")
+                    parts.append("".join(
+                        f"  - {self.colored_text(subkey.capitalize() + ':', 'key')} {self.colored_text(value, 'value')}\n"
+                        for subkey, value in document[field].items()
+                    ))
                 else:
-                    print(f"{self.colored_text(field.capitalize() + ':', 'key')} {self.colored_text(document[field], 'value')}")
+                    parts.append(f"{self.colored_text(field.capitalize() + ':', 'key')} {self.colored_text(document[field], 'value')}\n")
         
-        print(self.colored_text("\n" + "-" * self.width, 'border'))
+        parts.append(self.colored_text("\n" + self.dash_rule, 'border') + "\n")
+        self.write_screen(parts)
     
     def display_veritas_hint(self, hint):
         """
@@ -255,10 +526,12 @@ class TerminalUI:
             hint (str): The hint to display.
         """
         # Using '=' instead of '-' for borders
-        print(self.colored_text("\n" + "=" * self.width, 'border'))
-        print(self.colored_text("VERITAS SAYS:".center(self.width), 'veritas'))
-        print(self.colored_text(f"\n\"{hint}\"\n", 'hint'))
-        print(self.colored_text("=" * self.width, 'border'))
+        self.write_screen([
+            self.colored_text("\n" + self.eq_rule, 'border') + "\n",
+            self.colored_text("VERITAS SAYS:".center(self.width), 'veritas') + "\n",
+            self.colored_text(f"\n\"{hint}\"\n", 'hint') + "\n",
+            self.colored_text(self.eq_rule, 'border') + "\n"
+        ])
     
     def display_rules(self, rules):
         """
@@ -267,43 +540,48 @@ class TerminalUI:
         Args:
             rules (list): List of Rule objects.
         """
-        self.clear_screen()
+        clear = self.clear_prefix()
         # Using '=' instead of '-' for borders
-        print(self.colored_text("\n" + "=" * self.width, 'border'))
-        print(self.colored_text("VERIFICATION RULES".center(self.width), 'title'))
-        print(self.colored_text("=" * self.width + "\n", 'border'))
+        parts = [
+            clear,
+            self.colored_text("\n" + self.eq_rule, 'border') + "\n",
+            self.colored_text("VERIFICATION RULES".center(self.width), 'title') + "\n",
+            self.colored_text(self.eq_rule + "\n", 'border') + "\n"
+        ]
         
         for i, rule in enumerate(rules, 1):
-            print(f"{self.colored_text(str(i) + '. ' + rule.name + ':', 'key')} {self.colored_text(rule.description, 'normal')}")
+            parts.append(f"{self.colored_text(str(i) + '. ' + rule.name + ':', 'key')} {self.colored_text(rule.description, 'normal')}\n")
         
-        print(self.colored_text("\n" + "-" * self.width, 'border'))
-        input(self.colored_text("\nPress Enter to return...", 'hint'))
+        parts.append(self.colored_text("\n" + self.dash_rule, 'border') + "\n")
+        self.write_screen(parts)
+        self.ask(self.colored_text("\nPress Enter to return...", 'hint'))
     
     def display_help(self):
         """
         Display help information.
         """
-        self.clear_screen()
-        # Using '=' instead of '-' for borders
-        print(self.colored_text("\n" + "=" * self.width, 'border'))
-        print(self.colored_text("AVAILABLE COMMANDS".center(self.width), 'title'))
-        print(self.colored_text("=" * self.width + "\n", 'border'))
-        
-        commands = [
-            ("approve", "Approve the current traveler"),
-            ("deny", "Deny the current traveler"),
-            ("hint", "Request a hint from Veritas"),
-            ("rules", "Display current verification rules"),
-            ("save", "Save your current game progress"),
-            ("help", "Show this help information"),
-            ("quit", "Exit the game")
-        ]
-        
-        for cmd, desc in commands:
-            print(f"{self.colored_text(cmd.ljust(10), 'command')} - {self.colored_text(desc, 'normal')}")
+        clear = self.clear_prefix()
+        self.write_screen([
+            clear,
+            self._cached_block('help_header', self._build_help_header),
+            _HELP_BODY,
+            self.colored_text("\n" + self.dash_rule, 'border') + "\n"
+        ])
+        self.ask(self.colored_text("\nPress Enter to return...", 'hint'))
+    
+    def _build_help_header(self):
+        """
+        Render the header of the help screen.
         
-        print(self.colored_text("\n" + "-" * self.width, 'border'))
-        input(self.colored_text("\nPress Enter to return...", 'hint'))
+        Returns:
+            str: The rendered header.
+        """
+        # Using '=' instead of '-' for borders
+        return "".join([
+            self.colored_text("\n" + self.eq_rule, 'border') + "\n",
+            self.colored_text("AVAILABLE COMMANDS".center(self.width), 'title') + "\n",
+            self.colored_text(self.eq_rule + "\n", 'border') + "\n"
+        ])
     
     def display_feedback(self, is_correct, narrative_update):
         """
@@ -314,11 +592,11 @@ class TerminalUI:
             narrative_update (str): The narrative update to display.
         """
         if is_correct:
-            self.colored_print("\n✓ Correct decision!", 'success')
+            verdict = self.colored_text("\n✓ Correct decision!", 'success')
         else:
-            self.colored_print("\n✗ Incorrect decision!", 'error')
+            verdict = self.colored_text("\n✗ Incorrect decision!", 'error')
         
-        print(self.colored_text(f"\n{narrative_update}", 'normal'))
+        self.write_screen([verdict + "\n", self.colored_text(f"\n{narrative_update}", 'normal') + "\n"])
     
     def display_ai_reasoning(self, reasoning, confidence):
         """
@@ -328,14 +606,15 @@ class TerminalUI:
             reasoning (str): The AI's reasoning.
             confidence (float): The AI's confidence level.
         """
-        print(self.colored_text("\nBorder Control AI Assessment:", 'header'))
-        
         # Color the confidence based on its level
         confidence_pct = int(confidence * 100)
         confidence_style = 'success' if confidence_pct > 75 else 'warning' if confidence_pct > 50 else 'error'
         
-        print(f"{self.colored_text('Confidence:', 'key')} {self.colored_text(f'{confidence_pct}%', confidence_style)}")
-        print(f"{self.colored_text('Reasoning:', 'key')} {self.colored_text(reasoning, 'normal')}")
+        self.write_screen([
+            self.colored_text("\nBorder Control AI Assessment:", 'header') + "\n",
+            f"{self.colored_text('Confidence:', 'key')} {self.colored_text(f'{confidence_pct}%', confidence_style)}\n",
+            f"{self.colored_text('Reasoning:', 'key')} {self.colored_text(reasoning, 'normal')}\n"
+        ])
     
     def display_game_over(self, ending_type, ending_message):
         """
@@ -345,31 +624,28 @@ class TerminalUI:
             ending_type (str): Type of ending ('good', 'bad', 'corrupt', 'strict').
             ending_message (str): The ending message to display.
         """
-        self.clear_screen()
-        self.draw_border("GAME OVER")
-        
-        print(self.colored_text(ending_message.center(self.width) + "\n", 'normal'))
-        
-        ending_style = {
-            'good': 'success',
-            'corrupt': 'error',
-            'strict': 'warning',
-            'bad': 'error'
-        }.get(ending_type, 'normal')
+        clear = self.clear_prefix()
+        self.write_screen([
+            clear,
+            self._cached_block('game_over', lambda: self.border_text("GAME OVER")),
+            self.colored_text(ending_message.center(self.width) + "\n", 'normal') + "\n",
+            self._cached_block(('ending', ending_type), lambda: self._build_ending_block(ending_type))
+        ])
+        self.ask(self.colored_text("\nPress Enter to exit...".center(self.width), 'hint'))
+    
+    def _build_ending_block(self, ending_type):
+        """
+        Render the closing lines of the game over screen for an ending type.
         
-        if ending_type == 'good':
-            msg = "Congratulations! You've successfully completed your mission."
-        elif ending_type == 'corrupt':
-            msg = "Your corruption has caught up with you."
-        elif ending_type == 'strict':
-            msg = "Your strict adherence to rules has made you unpopular."
-        else:
-            msg = "Your career has come to an unfortunate end."
+        Args:
+            ending_type (str): Type of ending ('good', 'bad', 'corrupt', 'strict').
             
-        print(self.colored_text(msg.center(self.width), ending_style))
-        
-        print("\n" + self.colored_text("=" * self.width, 'border'))
-        input(self.colored_text("\nPress Enter to exit...".center(self.width), 'hint'))
+        Returns:
+            str: The rendered block.
+        """
+        msg, ending_style = ENDINGS.get(ending_type, DEFAULT_ENDING)
+        return (self.colored_text(msg.center(self.width), ending_style) + "\n"
+                + "\n" + self.colored_text(self.eq_rule, 'border') + "\n")
     
     def get_user_input(self):
         """
@@ -379,10 +655,9 @@ class TerminalUI:
             str: The user's command.
         """
         try:
-            user_input = prompt(
-                HTML('<span style="fg:ansicyan">Enter command</span> <span style="fg:ansiwhite">&gt;</span> '),
-                completer=command_completer,
-                style=pt_style
+            self._active_completer = command_completer
+            user_input = self._get_session().prompt(
+                HTML('<span style="fg:ansicyan">Enter command</span> <span style="fg:ansiwhite">&gt;</span> ')
             )
             return user_input.strip().lower()
         except KeyboardInterrupt:
@@ -398,10 +673,12 @@ class TerminalUI:
             state_summary (str): Summary of the narrative state.
         """
         # Using '=' instead of '-' for borders
-        print(self.colored_text("\n" + "=" * self.width, 'border'))
-        print(f"{self.colored_text('Day:', 'key')} {self.colored_text(str(day), 'value')} | {self.colored_text('Score:', 'key')} {self.colored_text(str(score), 'value')}")
-        print(self.colored_text(state_summary, 'border_info'))
-        print(self.colored_text("=" * self.width, 'border'))
+        self.write_screen([
+            self.colored_text("\n" + self.eq_rule, 'border') + "\n",
+            f"{self.colored_text('Day:', 'key')} {self.colored_text(str(day), 'value')} | {self.colored_text('Score:', 'key')} {self.colored_text(str(score), 'value')}\n",
+            self.colored_text(state_summary, 'border_info') + "\n",
+            self.colored_text(self.eq_rule, 'border') + "\n"
+        ])
     
     def display_setting_info(self, setting):
         """
@@ -411,17 +688,19 @@ class TerminalUI:
             setting (dict): The current border setting.
         """
         # Using '=' instead of '-' for borders
-        print(self.colored_text("\n" + "=" * self.width, 'border'))
-        print(self.colored_text(f"CURRENT ASSIGNMENT: {setting['name']}", 'title'))
-        print(self.colored_text(f"\n{setting['situation']}", 'normal'))
-        
-        print(self.colored_text("\nDocument Requirements:", 'header'))
+        parts = [
+            self.colored_text("\n" + self.eq_rule, 'border') + "\n",
+            self.colored_text(f"CURRENT ASSIGNMENT: {setting['name']}", 'title') + "\n",
+            self.colored_text(f"\n{setting['situation']}", 'normal') + "\n",
+            self.colored_text("\nDocument Requirements:", 'header') + "\n"
+        ]
         for req in setting['document_requirements']:
-            print(self.colored_text(f"- {req}", 'normal'))
+            parts.append(self.colored_text(f"- {req}", 'normal') + "\n")
         
-        print(self.colored_text("\nCommon Issues:", 'header'))
+        parts.append(self.colored_text("\nCommon Issues:", 'header') + "\n")
         for issue in setting['common_issues']:
-            print(self.colored_text(f"- {issue}", 'normal'))
+            parts.append(self.colored_text(f"- {issue}", 'normal') + "\n")
             
-        print(self.colored_text("\n" + "-" * self.width, 'border'))
-        input(self.colored_text("\nPress Enter to continue...", 'hint'))
+        parts.append(self.colored_text("\n" + self.dash_rule, 'border') + "\n")
+        self.write_screen(parts)
+        self.ask(self.colored_text("\nPress Enter to continue...", 'hint'))
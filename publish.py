@@ -5,7 +5,9 @@ PyPI Publishing Script for Veritaminal
 This script builds and publishes the Veritaminal package to PyPI.
 """
 
+import importlib.util
 import subprocess
+import shutil
 import sys
 import os
 from pathlib import Path
@@ -14,9 +16,8 @@ def check_dependencies():
     """Ensure all required publishing tools are installed."""
     required = ["twine", "build"]
     for package in required:
-        try:
-            __import__(package)
-        except ImportError:
+        # find_spec locates the package without importing its dependency tree
+        if importlib.util.find_spec(package) is None:
             print(f"Installing required publishing dependency: {package}")
             subprocess.run([sys.executable, "-m", "pip", "install", package], check=True)
 
@@ -51,17 +52,8 @@ def upload_to_pypi():
 def clean():
     """Clean build artifacts."""
     print("Cleaning build artifacts...")
-    for path in ["build", "dist", "*.egg-info"]:
-        try:
-            subprocess.run(["rm", "-rf", path], check=True)
-        except Exception:
-            # On Windows, rmdir is different
-            if os.name == "nt":
-                if path == "*.egg-info":
-                    for egg_info in Path(".").glob("*.egg-info"):
-                        subprocess.run(["rmdir", "/S", "/Q", str(egg_info)], shell=True)
-                else:
-                    subprocess.run(["rmdir", "/S", "/Q", path], shell=True)
+    for path in [Path("build"), Path("dist"), *Path(".").glob("*.egg-info")]:
+        shutil.rmtree(path, ignore_errors=True)
 
 def main():
     """Run the publishing workflow."""
@@ -7,17 +7,10 @@ This standalone script allows you to run the game without installing it as a pac
 import os
 import sys
 import argparse
-from colorama import init, Fore, Style, Back
-
-# Initialize colorama for welcome message
-init(autoreset=True, convert=True, strip=False, wrap=True)
 
 # Add the project root directory to Python path to allow importing game modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import the main function from the game package
-from game.main import main
-
 def parse_args():
     """Parse command-line arguments for the game launcher."""
     parser = argparse.ArgumentParser(
@@ -27,11 +20,18 @@ def parse_args():
     
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     parser.add_argument('--load', type=str, help='Load a saved game from a specific file path')
+    parser.add_argument('--skip-menu', action='store_true', help='Skip main menu and start game immediately')
+    parser.add_argument('--fast', action='store_true', help='Generate traveler names locally to reduce API calls')
     
     return parser.parse_args()
 
 def print_welcome():
     """Print a welcome message with instructions."""
+    from colorama import just_fix_windows_console, Fore, Style, Back
+    
+    # Enable ANSI colors on Windows consoles; a no-op elsewhere
+    just_fix_windows_console()
+    
     print("\n" + Fore.BLUE + "="*80 + Style.RESET_ALL)
     print(Fore.YELLOW + Back.BLUE + " VERITAMINAL: Enhanced Edition ".center(80, '=') + Style.RESET_ALL)
     print(Fore.BLUE + "="*80 + Style.RESET_ALL)
@@ -44,26 +44,18 @@ def print_welcome():
     print("\n" + Fore.GREEN + "Starting game...\n" + Style.RESET_ALL)
 
 if __name__ == "__main__":
-    # Display welcome message
-    print_welcome()
-    
-    # Set up command line arguments to forward to the main game
+    # Parse arguments first so --help and usage errors skip loading the game
     args = parse_args()
     
-    # Convert args to list format for sys.argv
-    sys_args = []
-    if args.debug:
-        sys_args.append('--debug')
-    if args.load:
-        sys_args.append('--load')
-        sys_args.append(args.load)
+    # Display welcome message
+    print_welcome()
     
-    # Update sys.argv to pass arguments to main()
-    sys.argv[1:] = sys_args
+    # Import the main function from the game package
+    from game.main import main
     
-    # Run the game
+    # Run the game with the already-parsed arguments
     try:
-        sys.exit(main())
+        sys.exit(main(args))
     except KeyboardInterrupt:
         print("\nGame interrupted. Goodbye!")
         sys.exit(0)
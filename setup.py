@@ -34,7 +34,8 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "google-genai>=1.5.0",
+        "google-genai>=1.11.0",
+        "httpx>=0.28.1",
         "prompt_toolkit>=3.0.50",
         "python-dotenv>=1.0.1",
         "requests>=2.32.1",
@@ -10,7 +10,7 @@ import os
 import sys
 import subprocess
 import platform
-import shutil
+import venv
 from pathlib import Path
 
 def print_colored(text, color_code):
@@ -36,18 +36,20 @@ def create_virtual_env():
     print("Setting up a virtual environment...")
     
     venv_path = Path(".venv")
+    recreate = False
     if venv_path.exists():
         response = input("Virtual environment already exists. Recreate? (y/n): ")
         if response.lower() == 'y':
-            shutil.rmtree(venv_path)
+            recreate = True
         else:
             print("Using existing virtual environment.")
             return
 
     try:
-        subprocess.run([sys.executable, "-m", "venv", ".venv"], check=True)
+        # Build the environment in-process; clear=True replaces an existing one
+        venv.EnvBuilder(with_pip=True, clear=recreate).create(venv_path)
         print_colored("Virtual environment created successfully.", "32")
-    except subprocess.CalledProcessError:
+    except (OSError, subprocess.CalledProcessError):
         print_colored("Error creating virtual environment.", "31")
         sys.exit(1)
 
@@ -62,7 +64,13 @@ def install_dependencies():
         pip_path = Path(".venv") / "bin" / "pip"
     
     try:
-        subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+        # Prefer prebuilt wheels: no per-package build environments or compiling.
+        # Fall back to a regular install if some package only ships a source dist.
+        result = subprocess.run([str(pip_path), "install", "--only-binary=:all:", "--prefer-binary",
+                                 "-r", "requirements.txt"])
+        if result.returncode != 0:
+            print("Some packages have no prebuilt wheel; retrying with source builds allowed...")
+            subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
         print_colored("Dependencies installed successfully.", "32")
     except subprocess.CalledProcessError:
         print_colored("Error installing dependencies.", "31")